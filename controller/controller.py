@@ -1,67 +1,86 @@
+import random
 import sys
-import threading
-from model.board import Board
-from model.difficulty import Difficulty
+from model.board import Board, SafeZone
+from model.difficulty import Difficulty, CustomDifficulty, DIFFICULTY_TYPES
 from model.validator import Validator
+from model.validation_cache import ValidationCache
+from model.save_format import BinarySave, CSV_EXTENSION
 from view.minesweeper_viewer import MinesweeperViewer
-import time
-from icontract import require, ensure
+from controller.game_timer import GameTimer
+from shared.contracts import require, ensure, FULL
 
 class Controller:
     """Manages interactions between the model and views."""
 
     @require(lambda view: isinstance(view, MinesweeperViewer), "View must be an instance of MinesweeperViewer")
-    def __init__(self, view: MinesweeperViewer):
+    @require(lambda board_class: issubclass(board_class, Board), "Board class must be Board or a subclass of it")
+    @require(lambda safe_zone: safe_zone is None or isinstance(safe_zone, SafeZone), "Safe zone must be a SafeZone or None")
+    @require(lambda seed: seed is None or isinstance(seed, int), "Seed must be an integer or None")
+    def __init__(self, view: MinesweeperViewer, board_class: type = Board, safe_zone: SafeZone = None, seed: int = None,
+                 validation_cache: ValidationCache = None):
         """
         Initializes the Controller with a reference to the view.
 
         Args:
             view (MinesweeperViewer): The view that displays the Minesweeper game.
+            board_class (type): The board engine to create games with, Board or PackedBoard.
+            safe_zone (SafeZone): If given, boards defer mine placement to the first click
+                and keep this zone around it clear.
+            seed (int): Seed for the generator shared by every board this controller
+                creates, for reproducible games. If None, games are unseeded.
+            validation_cache (ValidationCache): Cache of validation results for loaded boards.
         """
         self.view = view
+        self.board_class = board_class
+        self.safe_zone = safe_zone
+        self.rng = random.Random(seed)
+        self.validation_cache = validation_cache
         self.board = None
         self.is_running = False
+        self.timer = GameTimer(view.schedule, view.cancel, self.show_time)
 
-    @require(lambda difficulty: isinstance(difficulty, Difficulty), "Difficulty must be an instance of Difficulty")
-    def set_difficulty(self, difficulty: Difficulty):
+    @require(lambda difficulty: isinstance(difficulty, DIFFICULTY_TYPES), "Difficulty must be a Difficulty or CustomDifficulty")
+    def set_difficulty(self, difficulty: Difficulty | CustomDifficulty):
         """
         Initializes the board with the specified difficulty and resets the view.
 
         Args:
-            difficulty (Difficulty): The difficulty settings for the game.
+            difficulty (Difficulty | CustomDifficulty): The difficulty settings for the game.
         """
-        self.board = Board(difficulty)
+        self.stop_game()  # A new board starts with a stopped clock
+        self.board = self.board_class(difficulty, self.safe_zone, self.rng)
         self.view.controller = self  # Provide the controller reference to the view
         self.view.initialize_board()  # Reset the view for the new board
+        self.show_time(0)
         self.update_view()
 
-    def update_timer(self):
+    def show_time(self, seconds):
         """
-        Periodically updates the view with the elapsed time from the model.
-        Runs in a separate thread to prevent blocking the main thread.
+        Shows the elapsed game time on the view. Called by the timer whenever the
+        displayed second changes.
+
+        Args:
+            seconds (int): The elapsed whole seconds.
         """
-        while self.is_running:
-            elapsed_time = self.board.update_timer()
-            self.view.update_timer(elapsed_time)
-            time.sleep(1)
-           
+        self.view.update_timer(Board.format_time(seconds))
+
     @ensure(lambda self: self.is_running, "Timer must be running after starting timer") 
     def start_timer(self):
         """
-        Starts polling the model for the current time once every second if not already started
+        Starts the board's clock and the timer that shows it, if not already started.
+        The timer ticks on the view's event loop, once per displayed second.
         """
-        # Update time regardless
-        elapsed_time = self.board.update_timer()
-        self.view.update_timer(elapsed_time)
+        self.board.update_timer()  # Starts the board clock on the first call
         if not self.is_running:
             self.is_running = True
-            threading.Thread(target=self.update_timer, daemon=True).start()
+            self.timer.start(self.board.elapsed_seconds())
 
     def stop_game(self):
         """
         Stops the game and timer by updating the running state.
         """
         self.is_running = False
+        self.timer.stop()
 
     @require(lambda self, x, y: self.board is not None and 0 <= x < self.board.dif.x_size and 0 <= y < self.board.dif.y_size,
              "Invalid cell coordinates or board not initialized")
@@ -112,9 +131,11 @@ class Controller:
     def update_view(self):
         """
         Notifies the view to update its display based on the current board state.
+        Only the cells that changed since the last update are passed on, unless the
+        board asks for a full redraw.
         """
         if self.board:
-            self.view.update(self.board)
+            self.view.update(self.board, self.board.pop_changes())
 
     @require(lambda self, won: isinstance(won, bool), "Game outcome must be a boolean")
     def handle_game_over(self, won):
@@ -152,8 +173,9 @@ class Controller:
         lambda self: self.board is not None, "The board must be loaded after this method."
     )
     @ensure(
-        lambda self, validate: not validate or Validator.validate_board(self.board),
+        lambda self, validate: not validate or Validator.validate_board(self.board, self.validation_cache),
         "If validation is enabled, the board must be valid after loading.",
+        enabled=FULL,
     )
     def load_existing_board(self, validate: bool):
         """
@@ -170,8 +192,8 @@ class Controller:
         file_path = self.view.get_existing_board_path()
         if file_path:
             try:
-                self.board.load_board_from_csv(file_path)
-                if validate and not Validator.validate_board(self.board):
+                self.board.load_board(file_path)
+                if validate and not Validator.validate_board(self.board, self.validation_cache):
                     raise ValueError("Loaded board is not valid")
                 elif self.board.start_time != None:
                     # Start timer if not in testing mode and the user had made a move before saving
@@ -184,25 +206,32 @@ class Controller:
 
     @require(lambda self, file_path: isinstance(file_path, str) and self.board is not None,
          "File path must be a string and the board must be initialized")
-    def save_game(self, file_path: str):
+    def save_game(self, file_path: str, exit_after: bool = True):
         """
         Saves the current game state to the specified file.
 
         Args:
             file_path (str): The path to save the game state.
+            exit_after (bool): Whether to clean up and exit after a successful save. Scripts
+                pass False to keep applying their remaining commands.
+
+        Returns:
+            bool: True if the board was saved, False if saving failed.
         """
-        # Ensure the file has a .csv extension
-        if not file_path.lower().endswith(".csv"):
-            file_path += ".csv"
+        # Ensure the file has a .csv or .msb extension, .msb saves in the binary format
+        if not (file_path.lower().endswith(CSV_EXTENSION) or BinarySave.is_binary_path(file_path)):
+            file_path += CSV_EXTENSION
 
         try:
             # Save the board to the CSV file
-            self.board.save_board_to_csv(file_path)
+            self.board.save_board(file_path)
 
         except Exception as e:
             # Handle save failure
             self.view.display_message(f"Error saving board: {e}")
-            return
+            return False
 
         # Call cleanup but avoid duplicating window destruction
-        self.view.cleanup()
+        if exit_after:
+            self.view.cleanup()
+        return True
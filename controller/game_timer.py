@@ -0,0 +1,83 @@
+import time
+from shared.contracts import require, ensure
+
+
+class GameTimer:
+    """
+    Game clock that ticks on the view's own event loop instead of a thread.
+
+    Time is measured with a monotonic clock, and a tick is scheduled for the moment
+    the displayed second changes, so the callback runs once per second shown.
+    """
+
+    @require(lambda schedule, cancel, on_tick: callable(schedule) and callable(cancel) and callable(on_tick))
+    def __init__(self, schedule, cancel, on_tick, clock=time.monotonic):
+        """
+        Initializes a stopped timer.
+
+        Args:
+            schedule (Callable[[float, Callable], object]): Runs a callback after a delay in
+                seconds on the view's loop and returns a handle for `cancel`.
+            cancel (Callable[[object], None]): Cancels a scheduled callback by its handle.
+            on_tick (Callable[[int], None]): Called with the elapsed whole seconds whenever
+                they change.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+        """
+        self.schedule = schedule
+        self.cancel = cancel
+        self.on_tick = on_tick
+        self.clock = clock
+        self.origin = None  # Clock time at which the elapsed time was 0
+        self.shown_seconds = None
+        self.job = None
+
+    @property
+    def is_running(self):
+        """
+        Returns whether the timer is ticking.
+
+        Returns:
+            bool: True between start and stop.
+        """
+        return self.origin is not None
+
+    @require(lambda elapsed_seconds: elapsed_seconds >= 0, "Elapsed time cannot be negative")
+    @ensure(lambda self: self.is_running)
+    def start(self, elapsed_seconds: float = 0):
+        """
+        Starts or restarts the timer at the given elapsed time and shows it right away.
+
+        Args:
+            elapsed_seconds (float): The time already played, e.g. from a loaded game.
+        """
+        self.stop()
+        self.origin = self.clock() - elapsed_seconds
+        self.tick()
+
+    @ensure(lambda self: not self.is_running)
+    def stop(self):
+        """
+        Stops the timer and cancels its pending tick. The displayed time is kept.
+        """
+        if self.job is not None:
+            self.cancel(self.job)
+            self.job = None
+        self.origin = None
+        self.shown_seconds = None
+
+    def tick(self):
+        """
+        Reports the elapsed seconds if they changed and schedules the next tick for
+        the start of the next second.
+        """
+        self.job = None
+        if self.origin is None:
+            return
+        elapsed = self.clock() - self.origin
+        seconds = int(elapsed)
+        if seconds != self.shown_seconds:
+            self.shown_seconds = seconds
+            self.on_tick(seconds)
+            if self.origin is None:
+                return  # Stopped by the callback
+        self.job = self.schedule(seconds + 1 - elapsed, self.tick)
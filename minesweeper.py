@@ -6,7 +6,7 @@ from tkinter import messagebox as tkMessageBox
 from collections import deque
 import random
 import platform
-from datetime import datetime
+import time
 
 SIZE_X = 10
 SIZE_Y = 10
@@ -20,6 +20,18 @@ BTN_FLAG = "<Button-2>" if platform.system() == 'Darwin' else "<Button-3>"
 
 window = None
 
+# neighbor coordinates of every tile, computed once for the board size
+NEIGHBORS = [
+    [
+        [(nx, ny)
+         for nx in range(max(x-1, 0), min(x+2, SIZE_X))
+         for ny in range(max(y-1, 0), min(y+2, SIZE_Y))
+         if (nx, ny) != (x, y)]
+        for y in range(SIZE_Y)
+    ]
+    for x in range(SIZE_X)
+]
+
 class Minesweeper:
 
     # tkinter view
@@ -138,33 +150,19 @@ class Minesweeper:
     # model.board
     def updateTimer(self):
         ts = "00:00:00"
+        delay = 1000
         if self.startTime != None:
-            delta = datetime.now() - self.startTime
-            ts = str(delta).split('.')[0] # drop ms
-            if delta.total_seconds() < 36000:
-                ts = "0" + ts # zero-pad
-        self.labels["time"].config(text = ts)
-        self.frame.after(100, self.updateTimer)
+            elapsed = time.monotonic() - self.startTime
+            seconds = int(elapsed)
+            ts = "%02d:%02d:%02d" % (seconds // 3600, seconds // 60 % 60, seconds % 60)
+            delay = int((seconds + 1 - elapsed) * 1000) + 1 # wake up when the shown second changes
+        if ts != self.labels["time"].cget("text"):
+            self.labels["time"].config(text = ts)
+        self.frame.after(delay, self.updateTimer)
 
     # model.board
     def getNeighbors(self, x, y):
-        neighbors = []
-        coords = [
-            {"x": x-1,  "y": y-1},  #top right
-            {"x": x-1,  "y": y},    #top middle
-            {"x": x-1,  "y": y+1},  #top left
-            {"x": x,    "y": y-1},  #left
-            {"x": x,    "y": y+1},  #right
-            {"x": x+1,  "y": y-1},  #bottom right
-            {"x": x+1,  "y": y},    #bottom middle
-            {"x": x+1,  "y": y+1},  #bottom left
-        ]
-        for n in coords:
-            try:
-                neighbors.append(self.tiles[n["x"]][n["y"]])
-            except KeyError:
-                pass
-        return neighbors
+        return [self.tiles[nx][ny] for nx, ny in NEIGHBORS[x][y]]
 
     # tkinter view
     def onClickWrapper(self, x, y):
@@ -177,7 +175,7 @@ class Minesweeper:
     # tkinter view
     def onClick(self, tile):
         if self.startTime == None:
-            self.startTime = datetime.now()
+            self.startTime = time.monotonic()
 
         if tile["isMine"] == True:
             # end game
@@ -200,7 +198,7 @@ class Minesweeper:
     # tkinter view
     def onRightClick(self, tile):
         if self.startTime == None:
-            self.startTime = datetime.now()
+            self.startTime = time.monotonic()
 
         # if not clicked
         if tile["state"] == STATE_DEFAULT:
@@ -0,0 +1,249 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from model.board import Board, SafeZone
+from model.difficulty import Difficulty, DIFFICULTY_TYPES
+from model.validator import Validator
+from model.validation_cache import ValidationCache, DEFAULT_MAX_ENTRIES
+from shared.utility import Utility
+from shared.contracts import require, ensure, ViolationError
+
+
+class BoardLayout:
+    """
+    Compact, picklable description of a generated board.
+
+    Attributes:
+        difficulty (Difficulty | CustomDifficulty): The difficulty the board was generated for.
+        seed (int): The seed that reproduces this layout.
+        mines (tuple[int]): Flat indices (x * y_size + y) of the mines.
+        treasures (tuple[int]): Flat indices of the treasures.
+        nearby_mines (bytes): Number of adjacent mines of every cell, by flat index.
+        nearby_treasures (bytes): Number of adjacent treasures of every cell, by flat index.
+    """
+
+    __slots__ = ("difficulty", "seed", "mines", "treasures", "nearby_mines", "nearby_treasures")
+
+    def __init__(self, difficulty: Difficulty, seed: int, mines: tuple, treasures: tuple,
+                 nearby_mines: bytes, nearby_treasures: bytes):
+        self.difficulty = difficulty
+        self.seed = seed
+        self.mines = mines
+        self.treasures = treasures
+        self.nearby_mines = nearby_mines
+        self.nearby_treasures = nearby_treasures
+
+    @staticmethod
+    @require(lambda difficulty: isinstance(difficulty, DIFFICULTY_TYPES))
+    @require(lambda seed: isinstance(seed, int))
+    def generate(difficulty: Difficulty, seed: int):
+        """
+        Generates the layout for a seed, without building any cells.
+
+        Args:
+            difficulty (Difficulty | CustomDifficulty): The difficulty to generate for.
+            seed (int): The seed of the board.
+
+        Returns:
+            BoardLayout: The generated layout.
+        """
+        x_size, y_size = difficulty.x_size, difficulty.y_size
+        mines, treasures = Utility.sample_items(
+            x_size * y_size, difficulty.max_mines, difficulty.max_treasures, random.Random(seed)
+        )
+
+        mine_plane = bytearray(x_size * y_size)
+        for index in mines:
+            mine_plane[index] = 1
+        treasure_plane = bytearray(x_size * y_size)
+        for index in treasures:
+            treasure_plane[index] = 1
+
+        return BoardLayout(
+            difficulty, seed, tuple(mines), tuple(treasures),
+            Utility.neighbor_sums(mine_plane, x_size, y_size), Utility.neighbor_sums(treasure_plane, x_size, y_size),
+        )
+
+    @require(lambda board_class: issubclass(board_class, Board), "Board class must be Board or a subclass of it")
+    @ensure(lambda self, result: result.actual_mines == len(self.mines))
+    def to_board(self, board_class: type = Board):
+        """
+        Builds a full, playable board with this layout.
+
+        The board draws moved mines and restarts from a generator seeded with the
+        layout's seed, so it behaves the same every time it is rebuilt.
+
+        Args:
+            board_class (type): The board engine to build, Board or PackedBoard.
+
+        Returns:
+            Board: The new board.
+        """
+        return board_class.from_layout(self.difficulty, self.mines, self.treasures, self.seed)
+
+
+def _generate_chunk(difficulty: Difficulty, seeds: list):
+    """
+    Generates the layouts for a chunk of seeds inside a worker process.
+    """
+    return [BoardLayout.generate(difficulty, seed) for seed in seeds]
+
+
+class BatchGenerator:
+    """Generates many boards at once for leaderboards and bot evaluation."""
+
+    @staticmethod
+    @require(lambda difficulty: isinstance(difficulty, DIFFICULTY_TYPES), "Difficulty must be a Difficulty or CustomDifficulty")
+    @require(lambda count: isinstance(count, int) and count >= 0, "count must be a non-negative integer")
+    @require(lambda seed: isinstance(seed, int), "seed must be an integer")
+    @require(lambda workers: workers is None or (isinstance(workers, int) and workers >= 1), "workers must be None or positive")
+    @require(lambda chunk_size: isinstance(chunk_size, int) and chunk_size >= 1, "chunk_size must be positive")
+    def generate(difficulty: Difficulty, count: int, seed: int = 0, workers: int = None, chunk_size: int = 256):
+        """
+        Yields `count` board layouts for a difficulty, in order.
+
+        Every board gets its own seed, drawn from a generator seeded with `seed`, so the
+        same arguments always yield the same boards whatever the number of workers.
+
+        Args:
+            difficulty (Difficulty | CustomDifficulty): The difficulty of every board.
+            count (int): The number of boards to generate.
+            seed (int): The seed of the whole batch.
+            workers (int): The number of worker processes. 1 generates in this process,
+                None uses one process per CPU.
+            chunk_size (int): The number of boards each worker task generates.
+
+        Yields:
+            BoardLayout: The generated layouts, call `to_board()` for a playable board.
+        """
+        seeds = BatchGenerator.board_seeds(seed, count)
+        if workers == 1:
+            for board_seed in seeds:
+                yield BoardLayout.generate(difficulty, board_seed)
+            return
+
+        chunks = [seeds[start:start + chunk_size] for start in range(0, count, chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for layouts in pool.map(_generate_chunk, [difficulty] * len(chunks), chunks):
+                yield from layouts
+
+    @staticmethod
+    @require(lambda count: count >= 0)
+    @ensure(lambda result, count: len(result) == count)
+    def board_seeds(seed: int, count: int):
+        """
+        Derives the per-board seeds of a batch.
+
+        Args:
+            seed (int): The seed of the whole batch.
+            count (int): The number of boards.
+
+        Returns:
+            list[int]: One 64-bit seed per board, the i-th seed only depends on `seed` and i.
+        """
+        rng = random.Random(seed)
+        return [rng.getrandbits(64) for _ in range(count)]
+
+
+def _error_message(error: Exception):
+    """
+    Returns a one-line description of why loading a board failed.
+    """
+    lines = str(error).splitlines()
+    if not lines:
+        return type(error).__name__
+    if isinstance(error, ViolationError) and len(lines) > 1:
+        return lines[1].split(": ", 1)[0]  # Violations start with the location, then "description: condition"
+    if isinstance(error, ValueError):
+        return lines[0]  # The loader reports bad files with ValueError
+    return f"{type(error).__name__}: {lines[0]}"
+
+
+def _validate_chunk(paths: list, cache_path: str = None, cache_size: int = DEFAULT_MAX_ENTRIES):
+    """
+    Validates a chunk of saved boards inside a worker process, with its own cache connection.
+    """
+    cache = ValidationCache(cache_path, cache_size) if cache_path else None
+    try:
+        return [BatchValidator.validate_file(path, cache) for path in paths]
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+class BatchValidator:
+    """Validates many saved boards at once, for fixtures and user uploads."""
+
+    @staticmethod
+    @require(lambda path: isinstance(path, str))
+    @ensure(lambda result: result["valid"] == (result["rule"] is None))
+    def validate_file(path: str, cache: ValidationCache = None):
+        """
+        Loads a saved board and validates it.
+
+        Args:
+            path (str): The path to the CSV or binary (.msb) save.
+            cache (ValidationCache): Cache of validation results by board layout.
+
+        Returns:
+            dict: The result, with the keys
+                file (str): The path.
+                valid (bool): True if the board loaded and passed every rule.
+                difficulty (str | None): The detected preset, CUSTOM, or None if loading failed.
+                rule (str | None): "load" or the first Validator rule the board breaks, None if valid.
+                message (str | None): Why the board failed.
+                load_ms (float): Time spent loading the file.
+                validate_ms (float): Time spent validating the board.
+                cached (bool): True if the verdict came from the cache.
+        """
+        board = Board(Difficulty.BEGINNER, SafeZone.CELL)  # No items are placed, the file replaces the cells
+        started = time.perf_counter()
+        result = {"file": path, "valid": False, "difficulty": None, "rule": None, "message": None, "cached": False}
+        try:
+            board.load_board(path)
+        except Exception as e:  # Malformed files fail in many ways, each one is reported rather than raised
+            loaded = time.perf_counter()
+            result.update(rule="load", message=_error_message(e))
+        else:
+            loaded = time.perf_counter()
+            result["difficulty"] = board.dif.name if isinstance(board.dif, Difficulty) else "CUSTOM"
+            hits = cache.hits if cache is not None else 0
+            violation = Validator.find_violation(board, cache)
+            result["cached"] = cache is not None and cache.hits > hits
+            if violation is None:
+                result["valid"] = True
+            else:
+                result["rule"], result["message"] = violation
+        finished = time.perf_counter()
+        result["load_ms"] = round((loaded - started) * 1000, 3)
+        result["validate_ms"] = round((finished - loaded) * 1000, 3)
+        return result
+
+    @staticmethod
+    @require(lambda workers: workers is None or (isinstance(workers, int) and workers >= 1), "workers must be None or positive")
+    @require(lambda chunk_size: isinstance(chunk_size, int) and chunk_size >= 1, "chunk_size must be positive")
+    def validate(paths: list, workers: int = None, chunk_size: int = 64, cache_path: str = None,
+                 cache_size: int = DEFAULT_MAX_ENTRIES):
+        """
+        Yields the validation result of every saved board, in the order of `paths`.
+
+        Args:
+            paths (list[str]): The paths to the CSV files.
+            workers (int): The number of worker processes. 1 validates in this process,
+                None uses one process per CPU.
+            chunk_size (int): The number of files each worker task validates.
+            cache_path (str): The path of a ValidationCache file shared by the workers, or None.
+            cache_size (int): The most entries the cache keeps.
+
+        Yields:
+            dict: The result of each file, see `validate_file`.
+        """
+        chunks = [paths[start:start + chunk_size] for start in range(0, len(paths), chunk_size)]
+        if workers == 1:
+            for chunk in chunks:
+                yield from _validate_chunk(chunk, cache_path, cache_size)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for results in pool.map(_validate_chunk, chunks, [cache_path] * len(chunks), [cache_size] * len(chunks)):
+                yield from results
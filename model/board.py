@@ -1,28 +1,81 @@
 import random
-from model.difficulty import Difficulty
+from enum import Enum
+from model.difficulty import Difficulty, CustomDifficulty, DIFFICULTY_TYPES
 from model.cell import Cell, CellType
+from model.save_format import BinarySave, CsvSave, CSV_EXTENSION
 from shared.utility import Utility
-from datetime import datetime, timedelta
+import time
 import csv
-from icontract import require, ensure, invariant
+import hashlib
+from collections import deque
+from bisect import bisect_right, insort
+from shared.contracts import require, ensure, invariant, SLOW, FULL
 
 
-@invariant(lambda self: 0 <= self.flag_count <= (self.dif.x_size * self.dif.y_size))
-@invariant(lambda self: 0 <= self.correct_flag_count <= self.actual_mines)
+# Cell type and flag of each saved state, see CellType
+_STATE_TYPES = (CellType.EMPTY, CellType.MINE, CellType.TREASURE, CellType.MINE, CellType.EMPTY, CellType.EMPTY, CellType.TREASURE)
+_FLAGGED_STATES = frozenset((CellType.MINE_FLAGGED.value, CellType.EMPTY_FLAGGED.value, CellType.TREASURE_FLAGGED.value))
+
+
+class SafeZone(Enum):
+    """Defines which cells are kept clear when mine placement is deferred to the first click."""
+    CELL = 1  # Only the clicked cell
+    AREA = 2  # The clicked cell and its 3x3 neighborhood
+
+
+@invariant(lambda self: 0 <= self.flag_count <= (self.dif.x_size * self.dif.y_size), enabled=FULL)
+@invariant(lambda self: 0 <= self.correct_flag_count <= self.actual_mines, enabled=FULL)
 class Board:
     """Represents the Minesweeper game board."""
 
-    @require(lambda difficulty: isinstance(difficulty, Difficulty))
-    def __init__(self, difficulty: Difficulty):
+    @require(lambda difficulty: isinstance(difficulty, DIFFICULTY_TYPES))
+    @require(lambda safe_zone: safe_zone is None or isinstance(safe_zone, SafeZone))
+    @require(lambda rng: rng is None or isinstance(rng, (int, random.Random)), "rng must be a random.Random, a seed or None")
+    def __init__(self, difficulty: Difficulty, safe_zone: SafeZone = None, rng: random.Random | int = None):
         """
         Initializes the Board with the given difficulty level.
 
         Args:
-            difficulty (Difficulty): The difficulty settings of the game.
+            difficulty (Difficulty | CustomDifficulty): The difficulty settings of the game.
+            safe_zone (SafeZone): If given, no mines or treasures are placed until the
+                first reveal, and this zone around the first revealed cell is kept clear.
+                If None, items are placed immediately and a mine on the first click is moved.
+            rng (random.Random | int): Random generator for item placement, or a seed for a
+                new one. Restarts keep drawing from the same generator, so a seed fixes the
+                whole sequence of boards. If None, an unseeded generator is used.
         """
         self.dif = difficulty
+        self.safe_zone = safe_zone
+        self.rng = rng if isinstance(rng, random.Random) else random.Random(rng)
         self.restart()
 
+    @classmethod
+    @require(lambda difficulty: isinstance(difficulty, DIFFICULTY_TYPES))
+    @require(lambda difficulty, mines: difficulty.min_mines <= len(mines) <= difficulty.max_mines,
+             "Number of mines must be within the range of the difficulty.")
+    @require(lambda difficulty, treasures: difficulty.min_treasures <= len(treasures) <= difficulty.max_treasures,
+             "Number of treasures must be within the range of the difficulty.")
+    @require(lambda difficulty, mines, treasures: len(set(mines) | set(treasures)) == len(mines) + len(treasures)
+             and all(0 <= index < difficulty.x_size * difficulty.y_size for index in list(mines) + list(treasures)),
+             "Mines and treasures must be distinct cells on the board.", enabled=FULL)
+    def from_layout(cls, difficulty: Difficulty, mines, treasures, rng: random.Random | int = None):
+        """
+        Creates a board with the given mines and treasures instead of random ones.
+
+        Args:
+            difficulty (Difficulty | CustomDifficulty): The difficulty settings of the game.
+            mines (Sequence[int]): Flat indices (x * y_size + y) of the mines.
+            treasures (Sequence[int]): Flat indices of the treasures.
+            rng (random.Random | int): Generator used for moved mines and restarts, or a seed.
+
+        Returns:
+            Board: A ready to play board of this class.
+        """
+        board = cls(difficulty, SafeZone.CELL, rng)  # Starts out empty, with placement pending
+        board.safe_zone = None  # Play and restart like an eagerly placed board
+        board._install_layout(list(mines), list(treasures))
+        return board
+
     def setup(self):
         """
         Sets up the initial game state by initializing flags, counters,
@@ -32,9 +85,24 @@ class Board:
         self.correct_flag_count = 0
         self.clicked_count = 0
         self.start_time = None
-
+        self.last_revealed = set()
+        self._changes = None  # Views redraw the whole board first
+        self._index_neighbors()
+
+        if self.safe_zone is not None:
+            # Defer placement to the first reveal, the board starts out all empty
+            self.items_pending = True
+            self._clear_cells()
+            self.actual_mines = self.dif.max_mines  # Mines that will be placed
+            self.safe_cells, self.revealed_safe_cells = self.dif.x_size * self.dif.y_size, 0
+            self._occupied = []
+            return
+
+        self.items_pending = False
         self.place_items()  # Distribute mines and treasures
         self.count_mines_treasures()  # Calculate nearby mines and treasures for each cell
+        self.safe_cells, self.revealed_safe_cells = self._scan_safe_cells()
+        self._occupied = self._scan_occupied_cells()
 
     def restart(self):
         """
@@ -48,6 +116,9 @@ class Board:
         """
         Reveals a cell on the board and updates the game state.
 
+        The coordinates of every cell revealed by this action are stored in
+        `last_revealed`. `clicked_count` counts player actions, not cells.
+
         Args:
             x (int): X-coordinate of the cell.
             y (int): Y-coordinate of the cell.
@@ -58,6 +129,9 @@ class Board:
         self.update_timer()
 
         self.clicked_count += 1
+        self.last_revealed = set()
+        if self.items_pending:
+            self.place_items_around(x, y)
         cell: Cell = self.tiles[x][y]
 
         # Handle the first click to ensure it's not on a mine
@@ -68,24 +142,60 @@ class Board:
         if cell.is_checked or cell.is_flagged:
             return None
 
-        cell.is_checked = True  # Mark the cell as revealed
-
         if cell.type == CellType.MINE:
+            cell.is_checked = True
             return self.game_over(won=False)  # Lose if it's a mine
 
         if cell.type == CellType.TREASURE:
+            cell.is_checked = True
             return self.game_over(won=True)  # Win if it's a treasure
 
-        # If the cell is empty, reveal its neighbors recursively
-        if cell.nearby_mines == 0 and cell.nearby_treasures == 0:
-            for neighbor in self.get_neighbors(x, y):
-                if not neighbor.is_checked:
-                    self.reveal_cell(neighbor.x, neighbor.y)
+        # Reveal the cell, and the whole region around it if it is empty
+        self.last_revealed = self.reveal_region(x, y)
+        self.revealed_safe_cells += len(self.last_revealed)
+        self._mark_changed(self.last_revealed)
 
         # Check if all safe cells have been revealed
         if self._all_safe_cells_revealed():
             return self.game_over(won=True)
 
+    @require(lambda self, x, y: 0 <= x < self.dif.x_size and 0 <= y < self.dif.y_size)
+    @require(lambda self, x, y: self.tiles[x][y].type == CellType.EMPTY and not self.tiles[x][y].is_flagged)
+    @ensure(lambda self, result: isinstance(result, set) and all(self.tiles[x][y].is_checked for x, y in result),
+            enabled=FULL)
+    def reveal_region(self, x, y):
+        """
+        Reveals a safe cell and, if it has no nearby mines or treasures, the
+        whole connected region around it in a single breadth-first pass.
+
+        Args:
+            x (int): X-coordinate of the cell.
+            y (int): Y-coordinate of the cell.
+
+        Returns:
+            set: The (x, y) coordinates of every cell this call revealed.
+        """
+        offsets, indices = self._neighbors
+        cells = self._cells
+        start = x * self.dif.y_size + y
+        cells[start]._reveal()
+        changed = {(x, y)}
+
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            cell: Cell = cells[index]
+            if cell.nearby_mines != 0 or cell.nearby_treasures != 0:
+                continue  # Numbered cells bound the region
+
+            for neighbor_index in indices[offsets[index]:offsets[index + 1]]:
+                neighbor: Cell = cells[neighbor_index]
+                if not neighbor.is_checked and not neighbor.is_flagged:
+                    neighbor._reveal()
+                    changed.add((neighbor.x, neighbor.y))
+                    queue.append(neighbor_index)
+        return changed
+
     @require(lambda self, x, y: 0 <= x < self.dif.x_size and 0 <= y < self.dif.y_size)
     def toggle_flag(self, x, y):
         """
@@ -113,23 +223,66 @@ class Board:
             self.flag_count += 1
             if cell.type == CellType.MINE:
                 self.correct_flag_count += 1
+        self._mark_changed([(x, y)])
 
         # Win the game if all mines are correctly flagged
         if self.correct_flag_count == self.actual_mines and self.flag_count == self.actual_mines:
             return self.game_over(won=True)
 
+    def _mark_changed(self, cells):
+        """
+        Records cells whose display may have changed since the last call to pop_changes.
+
+        Args:
+            cells (Iterable[tuple[int, int]]): The (x, y) coordinates of the changed cells.
+        """
+        if self._changes is not None:  # A pending full redraw already covers them
+            self._changes.update(cells)
+
+    @ensure(lambda result: result is None or isinstance(result, set))
+    def pop_changes(self):
+        """
+        Returns the cells that changed since the last call and starts a new, empty delta.
+
+        Returns:
+            set | None: The (x, y) coordinates of the changed cells, or None if the whole
+            board must be redrawn, after setup, loading a board or game over.
+        """
+        changes, self._changes = self._changes, set()
+        return changes
+
+    @ensure(lambda self, result: result == all(
+                cell.type != CellType.EMPTY or cell.is_checked for row in self.tiles for cell in row
+            ),
+            "The safe cell counters must agree with a full scan of the board.",
+            enabled=SLOW)
     def _all_safe_cells_revealed(self):
         """
         Checks if all cells without mines or treasures have been revealed.
 
+        Reads the running counters in O(1); set ICONTRACT_SLOW to cross-check
+        them against a full scan of the board.
+
         Returns:
             bool: True if all safe cells are revealed, False otherwise.
         """
-        return all(
-            cell.type != CellType.EMPTY or cell.is_checked
-            for row in self.tiles
-            for cell in row
-        )
+        return self.revealed_safe_cells == self.safe_cells
+
+    def _scan_safe_cells(self):
+        """
+        Counts the safe cells and the revealed safe cells with a full scan of the board.
+
+        Returns:
+            tuple: (safe cells, revealed safe cells).
+        """
+        safe = 0
+        revealed = 0
+        for row in self.tiles:
+            for cell in row:
+                if cell.type == CellType.EMPTY:
+                    safe += 1
+                    revealed += cell.is_checked
+        return safe, revealed
 
     @ensure(lambda self, won: not self.is_running and won in {True, False})
     def game_over(self, won: bool):
@@ -144,6 +297,7 @@ class Board:
         """
         self.is_running = False  # Stop the timer
         self.reveal_all_tiles()  # Reveal all tiles for the final state
+        self._changes = None  # Nearly every cell changes, so views redraw the whole board
         return won
 
     def reveal_all_tiles(self):
@@ -152,7 +306,8 @@ class Board:
         """
         for row in self.tiles:
             for cell in row:
-                cell.is_checked = True
+                cell._reveal()  # Flagged cells are revealed too
+        self.revealed_safe_cells = self.safe_cells
 
     @require(lambda self, x, y: 0 <= x < self.dif.x_size and 0 <= y < self.dif.y_size)
     @ensure(lambda self, result: isinstance(result, list))
@@ -160,6 +315,8 @@ class Board:
         """
         Retrieves a list of neighboring cells around the specified coordinates.
 
+        Internal loops read the shared neighbor table directly instead of calling this.
+
         Args:
             x (int): X-coordinate of the cell.
             y (int): Y-coordinate of the cell.
@@ -167,19 +324,27 @@ class Board:
         Returns:
             list: A list of neighboring Cell objects.
         """
-        neighbors = []
-        coords = [
-            (x - 1, y - 1), (x - 1, y), (x - 1, y + 1),
-            (x, y - 1),               (x, y + 1),
-            (x + 1, y - 1), (x + 1, y), (x + 1, y + 1),
-        ]
-        for nx, ny in coords:
-            try:
-                if 0 <= nx < self.dif.x_size and 0 <= ny < self.dif.y_size:
-                    neighbors.append(self.tiles[nx][ny])
-            except IndexError:
-                pass # Ignore index errors
-        return neighbors
+        cells = self._cells
+        return [cells[neighbor_index] for neighbor_index in self._neighbor_indices(x * self.dif.y_size + y)]
+
+    def _index_neighbors(self):
+        """
+        Looks up the shared neighbor table for the current board shape.
+        """
+        self._neighbors = Utility.neighbor_table(self.dif.x_size, self.dif.y_size)
+
+    def _neighbor_indices(self, index):
+        """
+        Returns the flat indices of the neighbors of a cell.
+
+        Args:
+            index (int): The flat index (x * y_size + y) of the cell.
+
+        Returns:
+            Sequence[int]: A read-only view of the neighbor indices.
+        """
+        offsets, indices = self._neighbors
+        return indices[offsets[index]:offsets[index + 1]]
 
     @require(lambda self: self.dif.min_mines > self.dif.min_treasures,
             "Minimum number of mines must be greater than the minimum number of treasures.")
@@ -188,69 +353,197 @@ class Board:
     @ensure(lambda self: self.dif.min_mines <= self.actual_mines <= self.dif.max_mines,
             "Number of mines placed must be within the specified range.")
     @ensure(lambda self: self.dif.min_treasures <= sum(cell.type == CellType.TREASURE for row in self.tiles for cell in row) <= self.dif.max_treasures,
-            "Number of treasures placed must be within the specified range.")
+            "Number of treasures placed must be within the specified range.", enabled=FULL)
     @ensure(lambda self: self.actual_mines > sum(cell.type == CellType.TREASURE for row in self.tiles for cell in row),
-            "Number of mines must always be greater than the number of treasures.")
+            "Number of mines must always be greater than the number of treasures.", enabled=FULL)
     def place_items(self):
         """
         Randomly places mines and treasures on the board and initializes cells.
         """
         self.tiles: list[list[Cell]] = []
-        self.actual_mines = 0
-
-        # Distribute mines and treasures randomly
-        mines = Utility.randomly_distribute_values_2d(
-            (self.dif.x_size, self.dif.y_size), self.dif.min_mines, self.dif.max_mines
-        )
-        treasures = Utility.randomly_distribute_values_2d(
-            (self.dif.x_size, self.dif.y_size), self.dif.min_treasures, self.dif.max_treasures
-        )
-
-        for x in range(self.dif.x_size):
-            for y in range(self.dif.y_size):
-                if y == 0:
-                    self.tiles.append([])
-
-                cell_type = CellType.EMPTY
-                if treasures[x][y] == 1:
-                    cell_type = CellType.TREASURE
-                elif mines[x][y] == 1:
-                    cell_type = CellType.MINE
-                    self.actual_mines += 1
-
-                tile = Cell(cell_type, x, y)
-                self.tiles[x].append(tile)
+        x_size, y_size = self.dif.x_size, self.dif.y_size
+
+        mines, treasures = Utility.sample_items(x_size * y_size, self.dif.max_mines, self.dif.max_treasures, self.rng)
+        types = [CellType.EMPTY] * (x_size * y_size)
+        for index in mines:
+            types[index] = CellType.MINE
+        for index in treasures:
+            types[index] = CellType.TREASURE
+        self.actual_mines = len(mines)
+
+        for x in range(x_size):
+            self.tiles.append([Cell._new(types[x * y_size + y], x, y) for y in range(y_size)])
+
+        self._cells = [cell for row in self.tiles for cell in row]
+
+    def _clear_cells(self):
+        """
+        Fills the board with unchecked empty cells, without mines or treasures.
+        """
+        self.tiles = [
+            [Cell._new(CellType.EMPTY, x, y) for y in range(self.dif.y_size)]
+            for x in range(self.dif.x_size)
+        ]
+        self._cells = [cell for row in self.tiles for cell in row]
+
+    @require(lambda self, x, y: 0 <= x < self.dif.x_size and 0 <= y < self.dif.y_size)
+    @require(lambda self: self.items_pending, "Mines and treasures have already been placed.")
+    @ensure(lambda self: not self.items_pending)
+    @ensure(lambda self, x, y: self.tiles[x][y].type == CellType.EMPTY, "The revealed cell must be safe.")
+    def place_items_around(self, x, y):
+        """
+        Places the deferred mines and treasures in one pass, keeping the safe zone
+        around the given cell clear. Only the neighborhoods of the placed items are counted.
+
+        Args:
+            x (int): X-coordinate of the first revealed cell.
+            y (int): Y-coordinate of the first revealed cell.
+
+        Raises:
+            ValueError: If the board is too small to keep the safe zone clear.
+        """
+        index = x * self.dif.y_size + y
+        zone = [index]
+        if self.safe_zone == SafeZone.AREA:
+            zone.extend(self._neighbor_indices(index))
+        self._place_pending_items(sorted(zone))
+
+    def _place_pending_items(self, excluded):
+        """
+        Places the deferred mines and treasures anywhere except the excluded cells.
+
+        Args:
+            excluded (list[int]): Sorted flat indices (x * y_size + y) to keep clear.
+
+        Raises:
+            ValueError: If the board is too small to keep the excluded cells clear.
+        """
+        size = self.dif.x_size * self.dif.y_size
+        if self.dif.max_mines + self.dif.max_treasures > size - len(excluded):
+            raise ValueError("The board is too small to keep the safe zone clear.")
+
+        mines, treasures = Utility.sample_items(size, self.dif.max_mines, self.dif.max_treasures, self.rng, excluded)
+        self._install_layout(mines, treasures)
+
+    def _install_layout(self, mines, treasures):
+        """
+        Places the given mines and treasures on a board whose items are still pending.
+
+        Args:
+            mines (list[int]): Flat indices (x * y_size + y) of the mines.
+            treasures (list[int]): Flat indices of the treasures.
+        """
+        self._apply_layout(mines, treasures)
+        self.items_pending = False
+        self.actual_mines = len(mines)
+        if self.flag_count:
+            self.correct_flag_count = sum(self._cells[index].is_flagged for index in mines)
+        self._occupied = sorted(mines + treasures)
+        self.safe_cells = self.dif.x_size * self.dif.y_size - len(self._occupied)
+        self.revealed_safe_cells = 0
+
+    def _apply_layout(self, mines, treasures):
+        """
+        Turns empty cells into mines and treasures and counts their neighborhoods.
+
+        Args:
+            mines (list[int]): Flat indices (x * y_size + y) of the new mines.
+            treasures (list[int]): Flat indices of the new treasures.
+        """
+        offsets, indices = self._neighbors
+        cells = self._cells
+        for index in mines:
+            cells[index].type = CellType.MINE
+            for neighbor_index in indices[offsets[index]:offsets[index + 1]]:
+                cells[neighbor_index]._add_counts(1, 0)
+        for index in treasures:
+            cells[index].type = CellType.TREASURE
+            for neighbor_index in indices[offsets[index]:offsets[index + 1]]:
+                cells[neighbor_index]._add_counts(0, 1)
 
     def count_mines_treasures(self):
         """
         Updates the count of nearby mines and treasures for each cell.
         """
-        for x in range(self.dif.x_size):
-            for y in range(self.dif.y_size):
-                mc = 0
-                tc = 0
-                for neighbor in self.get_neighbors(x, y):
-                    mc += 1 if neighbor.type == CellType.MINE else 0
-                    tc += 1 if neighbor.type == CellType.TREASURE else 0
-                self.tiles[x][y].nearby_mines = mc
-                self.tiles[x][y].nearby_treasures = tc
+        offsets, indices = self._neighbors
+        cells = self._cells
+        types = [cell.type for cell in cells]
+        for index, cell in enumerate(cells):
+            mc = 0
+            tc = 0
+            for neighbor_index in indices[offsets[index]:offsets[index + 1]]:
+                mc += 1 if types[neighbor_index] == CellType.MINE else 0
+                tc += 1 if types[neighbor_index] == CellType.TREASURE else 0
+            cell._set_counts(mc, tc)
+
+    def _cell_totals(self):
+        """
+        Counts the mines, flags, correct flags and treasures on the board.
+
+        Returns:
+            tuple: (mines, flags, correct flags, treasures).
+        """
+        mines = flags = correct_flags = treasures = 0
+        for row in self.tiles:
+            for cell in row:
+                if cell.is_flagged:
+                    flags += 1
+                    correct_flags += cell.type == CellType.MINE
+                if cell.type == CellType.MINE:
+                    mines += 1
+                elif cell.type == CellType.TREASURE:
+                    treasures += 1
+        return mines, flags, correct_flags, treasures
+
+    def layout_key(self):
+        """
+        Hashes the mine and treasure layout of the board. Flags, revealed cells and the
+        game time are left out, so every save of the same board has the same key.
+
+        Returns:
+            str: A SHA-256 hex digest of the row lengths and cell types.
+        """
+        digest = hashlib.sha256()
+        for row in self.tiles:
+            digest.update(bytes([cell.type._value_ for cell in row]))  # _value_ skips the slow Enum.value property
+            digest.update(b"\n")  # Not a cell type, so rows of other lengths hash differently
+        return digest.hexdigest()
 
     def update_timer(self):
         """
-        Updates the game timer based on the elapsed time since the game started.
+        Starts the game clock if it is not running yet and returns the elapsed time.
 
         Returns:
             str: Formatted time string (hh:mm:ss).
         """
-        ts = "00:00:00"
-        if self.start_time:
-            delta = datetime.now() - self.start_time
-            ts = str(delta).split(".")[0]
-            if delta.total_seconds() < 36000:
-                ts = "0" + ts  # Add leading zero for single-digit hours
-        else:
-            self.start_time = datetime.now()
-        return ts
+        if self.start_time is None:
+            self.start_time = time.monotonic()
+        return self.format_time(self.elapsed_seconds())
+
+    def elapsed_seconds(self):
+        """
+        Returns the time played since the game clock started, on a monotonic clock.
+
+        Returns:
+            float: Elapsed seconds, 0 if the clock has not started.
+        """
+        return time.monotonic() - self.start_time if self.start_time is not None else 0.0
+
+    @staticmethod
+    @require(lambda seconds: seconds >= 0)
+    def format_time(seconds):
+        """
+        Formats a duration for display and saving.
+
+        Args:
+            seconds (float): The duration in seconds, fractions are dropped.
+
+        Returns:
+            str: The duration as hh:mm:ss.
+        """
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
 
     @require(lambda self, mine_x, mine_y: self.tiles[mine_x][mine_y].type == CellType.MINE)
     def move_mine(self, mine_x, mine_y):
@@ -264,70 +557,231 @@ class Board:
         Returns:
             tuple: The new coordinates of the moved mine.
         """
-        empty_spots = [
-            (x, y)
-            for x in range(self.dif.x_size)
-            for y in range(self.dif.y_size)
-            if self.tiles[x][y].type == CellType.EMPTY
+        new_x, new_y = self._random_empty_cell()
+
+        # Place the new mine first so the mine count never drops below the correct flags
+        self.set_cell_type(new_x, new_y, CellType.MINE)
+        self.set_cell_type(mine_x, mine_y, CellType.EMPTY)
+        return new_x, new_y
+
+    @require(lambda self, x, y: 0 <= x < self.dif.x_size and 0 <= y < self.dif.y_size)
+    @require(lambda new_type: new_type in {CellType.EMPTY, CellType.MINE, CellType.TREASURE})
+    @ensure(lambda self, x, y, new_type: self.tiles[x][y].type == new_type)
+    def set_cell_type(self, x, y, new_type: CellType):
+        """
+        Changes the type of a cell, updating only the counts of its 3x3 neighborhood
+        and the board counters instead of recounting the whole board.
+
+        Args:
+            x (int): X-coordinate of the cell.
+            y (int): Y-coordinate of the cell.
+            new_type (CellType): The new type of the cell (EMPTY, MINE or TREASURE).
+        """
+        index = x * self.dif.y_size + y
+        cells = self._cells
+        cell: Cell = cells[index]
+        old_type = cell.type
+        if old_type == new_type:
+            return
+
+        mine_delta = (new_type == CellType.MINE) - (old_type == CellType.MINE)
+        treasure_delta = (new_type == CellType.TREASURE) - (old_type == CellType.TREASURE)
+        cell.type = new_type
+        neighbor_indices = self._neighbor_indices(index)
+        for neighbor_index in neighbor_indices:
+            cells[neighbor_index]._add_counts(mine_delta, treasure_delta)
+        self._mark_changed(divmod(changed, self.dif.y_size) for changed in [index, *neighbor_indices])
+
+        self.actual_mines += mine_delta
+        if cell.is_flagged:
+            self.correct_flag_count += mine_delta
+
+        if old_type == CellType.EMPTY:
+            self.safe_cells -= 1
+            self.revealed_safe_cells -= cell.is_checked
+            insort(self._occupied, index)
+        elif new_type == CellType.EMPTY:
+            self.safe_cells += 1
+            self.revealed_safe_cells += cell.is_checked
+            self._occupied.pop(bisect_right(self._occupied, index) - 1)
+
+    def _scan_occupied_cells(self):
+        """
+        Lists the flat indices of all mine and treasure cells with a full scan of the board.
+
+        Returns:
+            list: The sorted flat indices (x * y_size + y) of the non-empty cells.
+        """
+        return [
+            x * self.dif.y_size + y
+            for x, row in enumerate(self.tiles)
+            for y, cell in enumerate(row)
+            if cell.type != CellType.EMPTY
         ]
-        if not empty_spots:
+
+    def _random_empty_cell(self):
+        """
+        Picks a uniformly random empty cell using the sorted index of non-empty cells.
+
+        Runs in O(log k) for k mines and treasures, independent of the board size.
+
+        Returns:
+            tuple: The (x, y) coordinates of the chosen empty cell.
+
+        Raises:
+            ValueError: If the board has no empty cells.
+        """
+        empty_count = self.dif.x_size * self.dif.y_size - len(self._occupied)
+        if empty_count <= 0:
             raise ValueError("No empty spots available to move the mine.")
 
-        new_x, new_y = random.choice(empty_spots)
-        self.tiles[mine_x][mine_y].type = CellType.EMPTY
-        self.tiles[new_x][new_y].type = CellType.MINE
+        index = Utility.nth_free_index(self.rng.randrange(empty_count), self._occupied)
+        return divmod(index, self.dif.y_size)
 
-        self.count_mines_treasures()  # Recalculate counts after moving the mine
-        return new_x, new_y
+    @require(lambda file_path: isinstance(file_path, str))
+    def load_board(self, file_path: str, max_cells: int = None):
+        """
+        Loads a saved board, binary for .msb files and CSV otherwise.
+
+        Args:
+            file_path (str): The path to the save file.
+            max_cells (int): The most cells the board may have, MAX_CELLS by default.
+
+        Raises:
+            ValueError: If the file format is invalid, the board is too large or the file cannot be found.
+        """
+        if BinarySave.is_binary_path(file_path):
+            self.load_board_from_binary(file_path, max_cells)
+        else:
+            self.load_board_from_csv(file_path, max_cells)
 
     @require(lambda file_path: isinstance(file_path, str))
-    def load_board_from_csv(self, file_path: str):
+    def save_board(self, file_path: str):
+        """
+        Saves the board, binary for .msb files and CSV otherwise.
+
+        Args:
+            file_path (str): The path to the save file.
+
+        Raises:
+            IOError: If there is an issue writing to the file.
+        """
+        if BinarySave.is_binary_path(file_path):
+            self.save_board_to_binary(file_path)
+        else:
+            self.save_board_to_csv(file_path)
+
+    @classmethod
+    @require(lambda source, target: isinstance(source, str) and isinstance(target, str))
+    def convert_save(cls, source: str, target: str):
+        """
+        Converts a save file between CSV and binary, losslessly. The format of each
+        file follows its extension.
+
+        Args:
+            source (str): The save to read.
+            target (str): The save to write.
+
+        Raises:
+            ValueError: If the source cannot be loaded.
+        """
+        board = cls(Difficulty.BEGINNER, SafeZone.CELL)  # Nothing is placed, loading replaces the cells
+        board.load_board(source)
+        board.save_board(target)
+
+    @require(lambda file_path: isinstance(file_path, str))
+    def load_board_from_csv(self, file_path: str, max_cells: int = None):
         """
         Loads a board configuration and optionally the game time from a CSV file.
+        The file is checked row by row while it is read, and loading stops at the first
+        invalid line. The board is only replaced once the whole file is valid.
 
         Args:
             file_path (str): The path to the CSV file.
+            max_cells (int): The most cells the board may have, MAX_CELLS by default.
 
         Raises:
-            ValueError: If the file format is invalid or the file cannot be found.
+            ValueError: If the file format is invalid, the board is too large or the file cannot be found.
+                The message names the first invalid line and column.
         """
         try:
-            with open(file_path, "r") as file:
-                reader = csv.reader(file)
-                rows = list(reader)
-
-                # Check if the first row contains game time
-                game_time = "00:00:00"  # Default game time
-                if rows[0] and rows[0][0].startswith("Game Time:"):
-                    game_time = rows.pop(0)[0].split(": ", 1)[-1]
-                
-                self.start_time = None  # Reset the start time
-                self.clicked_count = 1 if game_time != "00:00:00" else 0  # Assume game has started if time is recorded
-
-                self.tiles = []
-                for x, row in enumerate(rows):
-                    self.tiles.append([])
-                    for y, value in enumerate(row):
-                        self.tiles[x].append(Cell(int(value), x, y))
-
-                # Try to guess the difficulty based on board data
-                self.dif = self.detect_difficulty()
-
-                # Recalculate mines and treasures
-                self.count_mines_treasures()
-
-                # Optionally restore the elapsed game time
-                if game_time != "00:00:00":
-                    delta_parts = list(map(int, game_time.split(":")))
-                    delta_seconds = delta_parts[0] * 3600 + delta_parts[1] * 60 + delta_parts[2]
-                    self.start_time = datetime.now() - timedelta(seconds=delta_seconds)
+            with open(file_path, "r", newline="") as file:
+                x_size, y_size, elapsed_seconds, states = CsvSave.read(file, max_cells)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {file_path}")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"The file is not a text CSV file: {e}")
+
+        self._load_states(states, y_size)
+        self._finish_load(elapsed_seconds)
+
+    @require(lambda file_path: isinstance(file_path, str))
+    def load_board_from_binary(self, file_path: str, max_cells: int = None):
+        """
+        Loads a board configuration and the game time from a binary save.
+
+        Args:
+            file_path (str): The path to the .msb file.
+            max_cells (int): The most cells the board may have, MAX_CELLS by default.
 
+        Raises:
+            ValueError: If the file format is invalid, the board is too large or the file cannot be found.
+        """
+        try:
+            with open(file_path, "rb") as file:
+                x_size, y_size, elapsed_seconds, states = BinarySave.read(file, max_cells)
         except FileNotFoundError:
             raise ValueError(f"File not found: {file_path}")
-        except csv.Error as e:
-            raise ValueError(f"Error reading CSV file: {e}")
-        
-    @require(lambda file_path: isinstance(file_path, str) and file_path.endswith(".csv"))
+
+        self._load_states(states, y_size)
+        self._finish_load(elapsed_seconds)
+
+    def _finish_load(self, elapsed_seconds: int):
+        """
+        Rebuilds the derived board state after the cells were loaded from a save.
+
+        Args:
+            elapsed_seconds (int): The saved game time, 0 if the game has not started.
+        """
+        self.start_time = None  # Reset the start time
+        self.clicked_count = 1 if elapsed_seconds else 0  # Assume game has started if time is recorded
+        self.items_pending = False
+        self._changes = None
+
+        # Try to guess the difficulty based on board data
+        self.dif = self.detect_difficulty()
+        self._index_neighbors()
+
+        # Recalculate mines and treasures
+        self.count_mines_treasures()
+        self.safe_cells, self.revealed_safe_cells = self._scan_safe_cells()
+        self._occupied = self._scan_occupied_cells()
+
+        # Optionally restore the elapsed game time
+        if elapsed_seconds:
+            self.start_time = time.monotonic() - elapsed_seconds
+
+    def _load_states(self, states: bytearray, y_size: int):
+        """
+        Builds the board tiles from the saved states of every cell.
+
+        Args:
+            states (bytearray): The state (0-6) of every cell in row-major order, already validated.
+            y_size (int): The number of columns.
+        """
+        self.tiles = []
+        new = Cell._new
+        for x, start in enumerate(range(0, len(states), y_size)):
+            row = []
+            for y, state in enumerate(states[start:start + y_size]):
+                cell = new(_STATE_TYPES[state], x, y)
+                cell._is_checked = state == CellType.EMPTY_CHECKED.value
+                cell._is_flagged = state in _FLAGGED_STATES
+                row.append(cell)
+            self.tiles.append(row)
+        self._cells = [cell for row in self.tiles for cell in row]
+
+    @require(lambda file_path: isinstance(file_path, str) and file_path.endswith(CSV_EXTENSION))
     def save_board_to_csv(self, file_path: str):
         """
         Saves the current board configuration and game time to a CSV file.
@@ -338,6 +792,9 @@ class Board:
         Raises:
             IOError: If there is an issue writing to the file.
         """
+        if self.items_pending:
+            self._place_pending_items([])  # Nothing revealed yet, so no safe zone to keep
+
         try:
             with open(file_path, mode="w", newline="") as file:
                 writer = csv.writer(file)
@@ -346,47 +803,78 @@ class Board:
                 writer.writerow([f"Game Time: {self.update_timer()}"])
 
                 # Write the board data
-                for row in self.tiles:
-                    writer.writerow([str(cell.to_csv_state()) for cell in row])
+                writer.writerows(self._csv_rows())
+        except IOError as e:
+            raise IOError(f"Error writing to file {file_path}: {e}")
+
+    @require(lambda file_path: isinstance(file_path, str) and BinarySave.is_binary_path(file_path))
+    def save_board_to_binary(self, file_path: str):
+        """
+        Saves the current board configuration and game time to a binary file.
+
+        Args:
+            file_path (str): The path to the .msb file.
+
+        Raises:
+            IOError: If there is an issue writing to the file.
+        """
+        if self.items_pending:
+            self._place_pending_items([])  # Nothing revealed yet, so no safe zone to keep
+
+        self.update_timer()  # Starts the clock like a CSV save does
+        data = BinarySave.encode(self._state_bytes(), len(self.tiles), len(self.tiles[0]), int(self.elapsed_seconds()))
+        try:
+            with open(file_path, mode="wb") as file:
+                file.write(data)
         except IOError as e:
             raise IOError(f"Error writing to file {file_path}: {e}")
 
+    def _state_bytes(self):
+        """
+        Returns the saved state of every cell.
+
+        Returns:
+            bytes: The state (0-6) of every cell in row-major order.
+        """
+        return bytes([cell.to_csv_state() for row in self.tiles for cell in row])
+
+    def _csv_rows(self):
+        """
+        Yields the saved state of every cell, one row at a time.
+
+        Yields:
+            list[str]: The single-digit states of one row of cells.
+        """
+        for row in self.tiles:
+            yield [str(cell.to_csv_state()) for cell in row]
+
     @require(lambda self: self.tiles, "The board must have tiles.")
     @require(lambda self: len(self.tiles) > 0, "The board must have at least one row.")
     @require(
         lambda self: all(len(row) == len(self.tiles[0]) for row in self.tiles),
         "All rows must have the same number of columns.",
+        enabled=FULL,
     )
     @ensure(
-        lambda result: isinstance(result, Difficulty),
-        "The detected difficulty must be a valid Difficulty.",
+        lambda result: isinstance(result, DIFFICULTY_TYPES),
+        "The detected difficulty must be a valid Difficulty or CustomDifficulty.",
     )
     def detect_difficulty(self):
         """
         Detects the difficulty of the current board based on its size and configuration.
+        Boards that match no preset get a CustomDifficulty fitted to their contents.
 
         Returns:
-            Difficulty: The detected difficulty level.
+            Difficulty | CustomDifficulty: The detected difficulty level.
 
         Raises:
-            ValueError: If the board does not match any predefined difficulty.
+            ValueError: If the board has no more mines than treasures.
         """
         x_size = len(self.tiles)
         y_size = len(self.tiles[0]) if x_size > 0 else 0
 
         # Update counts
-        self.actual_mines = sum(
-            1 for row in self.tiles for cell in row if cell.type == CellType.MINE
-        )
-        self.flag_count = sum(
-            1 for row in self.tiles for cell in row if cell.is_flagged
-        )
-        self.correct_flag_count = sum(
-            1 for row in self.tiles for cell in row if cell.type == CellType.MINE and cell.is_flagged
-        )
-        total_treasures = sum(
-            1 for row in self.tiles for cell in row if cell.type == CellType.TREASURE
-        )
+        self.actual_mines, self.flag_count, self.correct_flag_count, total_treasures = self._cell_totals()
 
         for difficulty in Difficulty:
             if (
@@ -397,4 +885,6 @@ class Board:
             ):
                 return difficulty
 
-        raise ValueError("The board does not match any predefined difficulty.")
+        if self.actual_mines <= total_treasures:
+            raise ValueError("The board does not match any predefined difficulty and has no more mines than treasures.")
+        return CustomDifficulty(x_size, y_size, self.actual_mines, self.actual_mines, total_treasures, total_treasures)
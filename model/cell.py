@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Union
-from icontract import require, ensure
+from shared.contracts import require, ensure
 
 
 class CellType(Enum):
@@ -30,10 +30,14 @@ class Cell:
         is_flagged (bool): Whether the cell is flagged.
         nearby_mines (int): Number of nearby mines (only for empty cells).
         nearby_treasures (int): Number of nearby treasures (only for empty cells).
+
+    The public setters validate every write. Board engine code that has already
+    established the preconditions uses the underscore methods instead, which
+    skip the contract wrappers.
     """
 
-    
-class Cell:
+    __slots__ = ("x", "y", "type", "_is_checked", "_is_flagged", "_nearby_mines", "_nearby_treasures")
+
     @require(
         lambda type, x, y: isinstance(type, (CellType, int)) and isinstance(x, int) and isinstance(y, int),
         "type must be a CellType or int, and coordinates must be integers",
@@ -173,7 +177,58 @@ class Cell:
             value (int): The new number of nearby treasures.
         """
         self._nearby_treasures = value
-        
+
+    @classmethod
+    def _new(cls, type: CellType, x: int, y: int):
+        """
+        Creates an unchecked, unflagged cell without running the constructor contracts.
+
+        Args:
+            type (CellType): The type of the cell.
+            x (int): The X-coordinate of the cell.
+            y (int): The Y-coordinate of the cell.
+
+        Returns:
+            Cell: The new cell.
+        """
+        cell = cls.__new__(cls)
+        cell.x = x
+        cell.y = y
+        cell.type = type
+        cell._is_checked = False
+        cell._is_flagged = False
+        cell._nearby_mines = 0
+        cell._nearby_treasures = 0
+        return cell
+
+    def _reveal(self):
+        """
+        Marks the cell as checked without validation, also when it is flagged.
+        """
+        self._is_checked = True
+
+    def _set_counts(self, mines: int, treasures: int):
+        """
+        Sets both neighbor counts without validation.
+
+        Args:
+            mines (int): The number of nearby mines.
+            treasures (int): The number of nearby treasures.
+        """
+        self._nearby_mines = mines
+        self._nearby_treasures = treasures
+
+    def _add_counts(self, mines: int, treasures: int):
+        """
+        Adjusts both neighbor counts by a delta without validation.
+
+        Args:
+            mines (int): The change in nearby mines.
+            treasures (int): The change in nearby treasures.
+        """
+        self._nearby_mines += mines
+        self._nearby_treasures += treasures
+
     def to_csv_state(self):
         """
         Returns the current state of the cell as a single digit
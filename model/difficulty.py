@@ -1,5 +1,5 @@
 from enum import Enum
-from icontract import require, invariant
+from shared.contracts import require, invariant
 
 
 @invariant(
@@ -85,3 +85,132 @@ class Difficulty(Enum):
             int: Minimum number of treasures.
         """
         return self.value[5]
+
+
+@invariant(
+    lambda self: self.min_treasures < self.min_mines,
+    "The number of treasures must always be less than the number of mines"
+)
+@invariant(
+    lambda self: self.max_treasures < self.max_mines,
+    "The maximum number of treasures must always be less than the maximum number of mines"
+)
+class CustomDifficulty:
+    """
+    Represents a custom difficulty level with an arbitrary board size and item counts.
+
+    Exposes the same attributes as Difficulty, so it is accepted everywhere a
+    Difficulty is. Use it for boards larger than the presets or with a custom
+    mine density.
+
+    Attributes:
+        x_size (int): The number of rows in the board.
+        y_size (int): The number of columns in the board.
+        max_mines (int): The maximum number of mines allowed.
+        min_mines (int): The minimum number of mines required.
+        max_treasures (int): The maximum number of treasures allowed.
+        min_treasures (int): The minimum number of treasures required.
+    """
+
+    @require(lambda x_size, y_size: x_size > 0 and y_size > 0, "The board must have at least one row and one column")
+    @require(lambda min_mines, max_mines: 0 <= min_mines <= max_mines, "min_mines must be between 0 and max_mines")
+    @require(lambda min_treasures, max_treasures: 0 <= min_treasures <= max_treasures,
+             "min_treasures must be between 0 and max_treasures")
+    @require(lambda x_size, y_size, max_mines, max_treasures: max_mines + max_treasures <= x_size * y_size,
+             "The mines and treasures must fit on the board")
+    def __init__(self, x_size: int, y_size: int, max_mines: int, min_mines: int, max_treasures: int, min_treasures: int):
+        """
+        Initializes the custom difficulty. Arguments follow the order of the Difficulty values.
+
+        Args:
+            x_size (int): The number of rows in the board.
+            y_size (int): The number of columns in the board.
+            max_mines (int): The maximum number of mines allowed.
+            min_mines (int): The minimum number of mines required.
+            max_treasures (int): The maximum number of treasures allowed.
+            min_treasures (int): The minimum number of treasures required.
+        """
+        self.value = (x_size, y_size, max_mines, min_mines, max_treasures, min_treasures)
+
+    @property
+    def name(self):
+        """
+        Returns the name of the difficulty, mirroring Difficulty.name.
+
+        Returns:
+            str: Always "CUSTOM".
+        """
+        return "CUSTOM"
+
+    @property
+    def x_size(self):
+        """
+        Returns the number of rows in the board.
+
+        Returns:
+            int: Number of rows.
+        """
+        return self.value[0]
+
+    @property
+    def y_size(self):
+        """
+        Returns the number of columns in the board.
+
+        Returns:
+            int: Number of columns.
+        """
+        return self.value[1]
+
+    @property
+    def max_mines(self):
+        """
+        Returns the maximum number of mines allowed.
+
+        Returns:
+            int: Maximum number of mines.
+        """
+        return self.value[2]
+
+    @property
+    def min_mines(self):
+        """
+        Returns the minimum number of mines required.
+
+        Returns:
+            int: Minimum number of mines.
+        """
+        return self.value[3]
+
+    @property
+    def max_treasures(self):
+        """
+        Returns the maximum number of treasures allowed.
+
+        Returns:
+            int: Maximum number of treasures.
+        """
+        return self.value[4]
+
+    @property
+    def min_treasures(self):
+        """
+        Returns the minimum number of treasures required.
+
+        Returns:
+            int: Minimum number of treasures.
+        """
+        return self.value[5]
+
+    def __eq__(self, other):
+        return isinstance(other, CustomDifficulty) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f"CustomDifficulty{self.value}"
+
+
+# Every type accepted where a difficulty is expected
+DIFFICULTY_TYPES = (Difficulty, CustomDifficulty)
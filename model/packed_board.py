@@ -0,0 +1,492 @@
+import hashlib
+from collections import deque
+from model.board import Board
+from model.cell import CellType
+from shared.utility import Utility
+from shared.contracts import require, ensure, FULL
+
+# Translation tables from saved CSV cell states to the packed arrays
+_STATE_TYPES = bytes([0, 1, 2, 1, 0, 0, 2]) + bytes(249)
+_STATE_FLAGGED = bytes([0, 0, 0, 1, 1, 0, 1]) + bytes(249)
+_STATE_CHECKED = bytes([0, 0, 0, 0, 0, 1, 0]) + bytes(249)
+
+# Translation tables from packed cell types to single-type planes
+_MINE_PLANE = bytes([0, 1, 0]) + bytes(253)
+_TREASURE_PLANE = bytes([0, 0, 1]) + bytes(253)
+_EMPTY_PLANE = bytes([1, 0, 0]) + bytes(253)
+
+# Translation table from saved cell states to CSV digits
+_STATE_DIGITS = bytes.maketrans(bytes(range(7)), b"0123456")
+
+# Saved cell state of every combination type | checked << 2 | flagged << 3, as in Cell.to_csv_state
+_COMBINED_STATES = bytes([0, 1, 2, 0, 5, 1, 2, 0, 4, 3, 6, 0, 4, 3, 6]) + bytes(241)
+
+
+class CellView:
+    """
+    Lightweight view of a single cell stored in a PackedBoard.
+
+    Exposes the same attributes as Cell so views and the validator can keep
+    reading `board.tiles[x][y]` regardless of the board engine.
+    """
+
+    __slots__ = ("_board", "_index", "x", "y")
+
+    def __init__(self, board, x: int, y: int):
+        self._board = board
+        self._index = x * board._y_size + y
+        self.x = x
+        self.y = y
+
+    @property
+    def type(self):
+        """
+        Returns the type of the cell.
+
+        Returns:
+            CellType: The type of the cell.
+        """
+        return CellType(self._board._types[self._index])
+
+    @type.setter
+    def type(self, value):
+        """
+        Sets the type of the cell.
+
+        Args:
+            value (CellType): The new type of the cell.
+        """
+        self._board._types[self._index] = value.value
+
+    @property
+    def is_checked(self):
+        """
+        Returns whether the cell has been checked.
+
+        Returns:
+            bool: True if the cell is checked, False otherwise.
+        """
+        return self._board._checked[self._index] == 1
+
+    @is_checked.setter
+    @require(lambda self, value: isinstance(value, bool), "is_checked must be a boolean")
+    @require(lambda self, value: not (self.is_flagged and value), "Cannot check a cell that is flagged")
+    def is_checked(self, value):
+        """
+        Sets the checked state of the cell.
+
+        Args:
+            value (bool): The new checked state of the cell.
+        """
+        self._board._checked[self._index] = value
+
+    @property
+    def is_flagged(self):
+        """
+        Returns whether the cell is flagged.
+
+        Returns:
+            bool: True if the cell is flagged, False otherwise.
+        """
+        return self._board._flagged[self._index] == 1
+
+    @is_flagged.setter
+    @require(lambda self, value: isinstance(value, bool), "is_flagged must be a boolean")
+    @require(lambda self, value: not (self.is_checked and value), "Cannot flag a cell that is already checked")
+    def is_flagged(self, value):
+        """
+        Sets the flagged state of the cell.
+
+        Args:
+            value (bool): The new flagged state of the cell.
+        """
+        self._board._flagged[self._index] = value
+
+    @property
+    def nearby_mines(self):
+        """
+        Returns the number of nearby mines.
+
+        Returns:
+            int: The number of mines adjacent to this cell.
+        """
+        return self._board._nearby_mines[self._index]
+
+    @nearby_mines.setter
+    @require(lambda value: isinstance(value, int) and 0 <= value <= 8, "nearby_mines must be an integer between 0 and 8")
+    def nearby_mines(self, value):
+        """
+        Sets the number of nearby mines.
+
+        Args:
+            value (int): The new number of nearby mines.
+        """
+        self._board._nearby_mines[self._index] = value
+
+    @property
+    def nearby_treasures(self):
+        """
+        Returns the number of nearby treasures.
+
+        Returns:
+            int: The number of treasures adjacent to this cell.
+        """
+        return self._board._nearby_treasures[self._index]
+
+    @nearby_treasures.setter
+    @require(lambda value: isinstance(value, int) and 0 <= value <= 8, "nearby_treasures must be an integer between 0 and 8")
+    def nearby_treasures(self, value):
+        """
+        Sets the number of nearby treasures.
+
+        Args:
+            value (int): The new number of nearby treasures.
+        """
+        self._board._nearby_treasures[self._index] = value
+
+    def _reveal(self):
+        """
+        Marks the cell as checked without validation, also when it is flagged.
+        """
+        self._board._checked[self._index] = 1
+
+    def _set_counts(self, mines: int, treasures: int):
+        """
+        Sets both neighbor counts without validation.
+
+        Args:
+            mines (int): The number of nearby mines.
+            treasures (int): The number of nearby treasures.
+        """
+        self._board._nearby_mines[self._index] = mines
+        self._board._nearby_treasures[self._index] = treasures
+
+    def _add_counts(self, mines: int, treasures: int):
+        """
+        Adjusts both neighbor counts by a delta without validation.
+
+        Args:
+            mines (int): The change in nearby mines.
+            treasures (int): The change in nearby treasures.
+        """
+        self._board._nearby_mines[self._index] += mines
+        self._board._nearby_treasures[self._index] += treasures
+
+    def to_csv_state(self):
+        """
+        Returns the current state of the cell as a single digit
+
+        Returns:
+            int: The current state of the cell as a single digit
+        """
+        cell_type = self.type
+        if self.is_flagged:
+            return {
+                CellType.MINE: CellType.MINE_FLAGGED,
+                CellType.EMPTY: CellType.EMPTY_FLAGGED,
+                CellType.TREASURE: CellType.TREASURE_FLAGGED,
+            }[cell_type].value
+        if self.is_checked and cell_type == CellType.EMPTY:
+            return CellType.EMPTY_CHECKED.value
+        return cell_type.value
+
+
+class _CellRow:
+    """Lightweight view of one row of a PackedBoard, indexable like list[Cell]."""
+
+    __slots__ = ("_board", "_x")
+
+    def __init__(self, board, x: int):
+        self._board = board
+        self._x = x
+
+    def __len__(self):
+        return self._board._y_size
+
+    def __getitem__(self, y: int):
+        y_size = self._board._y_size
+        if y < 0:
+            y += y_size
+        if not 0 <= y < y_size:
+            raise IndexError("cell index out of range")
+        return CellView(self._board, self._x, y)
+
+    def __iter__(self):
+        return (CellView(self._board, self._x, y) for y in range(self._board._y_size))
+
+
+class _CellSequence:
+    """Lightweight flat view of all cells of a PackedBoard, indexed by x * y_size + y."""
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __len__(self):
+        return len(self._board._types)
+
+    def __getitem__(self, index: int):
+        return CellView(self._board, *divmod(index, self._board._y_size))
+
+
+class PackedBoard(Board):
+    """
+    Minesweeper board that stores cell state in packed byte arrays.
+
+    Each of type, checked, flagged, nearby_mines and nearby_treasures is a
+    bytearray with one byte per cell in row-major order. Neighbor counts are
+    computed in one whole-board pass, and `tiles[x][y]` returns a CellView so
+    code written against Board keeps working unchanged.
+    """
+
+    @require(lambda self: self.dif.min_mines > self.dif.min_treasures,
+            "Minimum number of mines must be greater than the minimum number of treasures.")
+    @require(lambda self: self.dif.max_mines > self.dif.max_treasures,
+            "Maximum number of mines must be greater than the maximum number of treasures.")
+    @ensure(lambda self: self.dif.min_mines <= self.actual_mines <= self.dif.max_mines,
+            "Number of mines placed must be within the specified range.")
+    @ensure(lambda self: self.dif.min_treasures <= self._types.count(CellType.TREASURE.value) <= self.dif.max_treasures,
+            "Number of treasures placed must be within the specified range.", enabled=FULL)
+    @ensure(lambda self: self.actual_mines > self._types.count(CellType.TREASURE.value),
+            "Number of mines must always be greater than the number of treasures.", enabled=FULL)
+    def place_items(self):
+        """
+        Randomly places mines and treasures on the board and initializes the cell arrays.
+        """
+        self._clear_cells()
+
+        mines, treasures = Utility.sample_items(len(self._types), self.dif.max_mines, self.dif.max_treasures, self.rng)
+        self._apply_types(mines, treasures)
+        self.actual_mines = len(mines)
+
+    def _allocate(self, types: bytearray, y_size: int, checked: bytearray = None, flagged: bytearray = None):
+        """
+        Installs new cell arrays and the row views over them.
+
+        Args:
+            types (bytearray): The CellType value of every cell.
+            y_size (int): The number of columns.
+            checked (bytearray): The checked state of every cell, all unchecked if omitted.
+            flagged (bytearray): The flagged state of every cell, all unflagged if omitted.
+        """
+        size = len(types)
+        self._y_size = y_size
+        self._types = types
+        self._checked = checked if checked is not None else bytearray(size)
+        self._flagged = flagged if flagged is not None else bytearray(size)
+        self._nearby_mines = bytearray(size)
+        self._nearby_treasures = bytearray(size)
+        self.tiles = [_CellRow(self, x) for x in range(size // y_size)]
+        self._cells = _CellSequence(self)
+
+    def _clear_cells(self):
+        """
+        Fills the board with unchecked empty cells, without mines or treasures.
+        """
+        self._allocate(bytearray(self.dif.x_size * self.dif.y_size), self.dif.y_size)
+
+    def _apply_layout(self, mines, treasures):
+        """
+        Turns empty cells into mines and treasures and counts their neighborhoods.
+
+        Args:
+            mines (list[int]): Flat indices (x * y_size + y) of the new mines.
+            treasures (list[int]): Flat indices of the new treasures.
+        """
+        self._apply_types(mines, treasures)
+        self.count_mines_treasures()  # One whole-board pass beats per-item updates here
+
+    def _apply_types(self, mines, treasures):
+        """
+        Writes mine and treasure types into the type array, without counting.
+
+        Args:
+            mines (list[int]): Flat indices (x * y_size + y) of the mines.
+            treasures (list[int]): Flat indices of the treasures.
+        """
+        types = self._types
+        mine, treasure = CellType.MINE.value, CellType.TREASURE.value
+        for index in mines:
+            types[index] = mine
+        for index in treasures:
+            types[index] = treasure
+
+    def count_mines_treasures(self):
+        """
+        Updates the count of nearby mines and treasures for each cell.
+        """
+        x_size, y_size = self.dif.x_size, self.dif.y_size
+        self._nearby_mines = bytearray(Utility.neighbor_sums(self._types.translate(_MINE_PLANE), x_size, y_size))
+        self._nearby_treasures = bytearray(Utility.neighbor_sums(self._types.translate(_TREASURE_PLANE), x_size, y_size))
+
+    @require(lambda self, x, y: 0 <= x < self.dif.x_size and 0 <= y < self.dif.y_size)
+    @require(lambda self, x, y: self.tiles[x][y].type == CellType.EMPTY and not self.tiles[x][y].is_flagged)
+    @ensure(lambda self, result: isinstance(result, set) and all(self.tiles[x][y].is_checked for x, y in result),
+            enabled=FULL)
+    def reveal_region(self, x, y):
+        """
+        Reveals a safe cell and, if it has no nearby mines or treasures, the
+        whole connected region around it in a single breadth-first pass.
+
+        Args:
+            x (int): X-coordinate of the cell.
+            y (int): Y-coordinate of the cell.
+
+        Returns:
+            set: The (x, y) coordinates of every cell this call revealed.
+        """
+        x_size, y_size = self.dif.x_size, self.dif.y_size
+        checked, flagged = self._checked, self._flagged
+        mines, treasures = self._nearby_mines, self._nearby_treasures
+
+        start = x * y_size + y
+        checked[start] = 1
+        changed = {(x, y)}
+
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            if mines[index] or treasures[index]:
+                continue  # Numbered cells bound the region
+
+            cx, cy = divmod(index, y_size)
+            for nx in range(max(cx - 1, 0), min(cx + 2, x_size)):
+                row = nx * y_size
+                for ny in range(max(cy - 1, 0), min(cy + 2, y_size)):
+                    neighbor = row + ny
+                    if not checked[neighbor] and not flagged[neighbor]:
+                        checked[neighbor] = 1
+                        changed.add((nx, ny))
+                        queue.append(neighbor)
+        return changed
+
+    def _index_neighbors(self):
+        """
+        Does nothing: PackedBoard computes neighbors from coordinates instead of
+        a shared table, which would cost over 30 bytes per cell on very large boards.
+        """
+
+    def _neighbor_indices(self, index):
+        """
+        Returns the flat indices of the neighbors of a cell.
+
+        Args:
+            index (int): The flat index (x * y_size + y) of the cell.
+
+        Returns:
+            list[int]: The neighbor indices.
+        """
+        y_size = self._y_size
+        x_size = len(self._types) // y_size
+        x, y = divmod(index, y_size)
+        return [
+            nx * y_size + ny
+            for nx in range(max(x - 1, 0), min(x + 2, x_size))
+            for ny in range(max(y - 1, 0), min(y + 2, y_size))
+            if nx != x or ny != y
+        ]
+
+    def _scan_safe_cells(self):
+        """
+        Counts the safe cells and the revealed safe cells with a full scan of the board.
+
+        Returns:
+            tuple: (safe cells, revealed safe cells).
+        """
+        empty = int.from_bytes(self._types.translate(_EMPTY_PLANE), "big")
+        revealed = (empty & int.from_bytes(self._checked, "big")).to_bytes(len(self._types), "big")
+        return self._types.count(CellType.EMPTY.value), revealed.count(1)
+
+    def reveal_all_tiles(self):
+        """
+        Reveals all tiles on the board, typically when the game ends.
+        """
+        self._checked = bytearray(b"\x01" * len(self._types))
+        self.revealed_safe_cells = self.safe_cells
+
+    def _scan_occupied_cells(self):
+        """
+        Lists the flat indices of all mine and treasure cells with a full scan of the board.
+
+        Returns:
+            list: The sorted flat indices (x * y_size + y) of the non-empty cells.
+        """
+        empty = self._types.translate(_EMPTY_PLANE)
+        occupied = []
+        index = empty.find(0)
+        while index != -1:
+            occupied.append(index)
+            index = empty.find(0, index + 1)
+        return occupied
+
+    def _load_states(self, states: bytearray, y_size: int):
+        """
+        Builds the cell arrays from the saved states of every cell, in three translate calls.
+
+        Args:
+            states (bytearray): The state (0-6) of every cell in row-major order, already validated.
+            y_size (int): The number of columns.
+        """
+        self._allocate(
+            bytearray(states.translate(_STATE_TYPES)),
+            y_size,
+            bytearray(states.translate(_STATE_CHECKED)),
+            bytearray(states.translate(_STATE_FLAGGED)),
+        )
+
+    def _state_bytes(self):
+        """
+        Returns the saved state of every cell, combined from the cell arrays in one pass.
+
+        Returns:
+            bytes: The state (0-6) of every cell in row-major order.
+        """
+        combined = (
+            int.from_bytes(self._types, "big")
+            | int.from_bytes(self._checked, "big") << 2
+            | int.from_bytes(self._flagged, "big") << 3
+        )
+        return combined.to_bytes(len(self._types), "big").translate(_COMBINED_STATES)
+
+    def _csv_rows(self):
+        """
+        Yields the saved state of every cell, one row at a time.
+
+        Yields:
+            str: The single-digit states of one row of cells; csv.writer splits it into fields.
+        """
+        size = len(self._types)
+        digits = self._state_bytes().translate(_STATE_DIGITS).decode("ascii")
+        for start in range(0, size, self._y_size):
+            yield digits[start:start + self._y_size]
+
+    def layout_key(self):
+        """
+        Hashes the mine and treasure layout of the board, the same key as Board.layout_key.
+
+        Returns:
+            str: A SHA-256 hex digest of the row lengths and cell types.
+        """
+        digest = hashlib.sha256()
+        types = self._types
+        for start in range(0, len(types), self._y_size):
+            digest.update(types[start:start + self._y_size])
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def _cell_totals(self):
+        """
+        Counts the mines, flags, correct flags and treasures on the board.
+
+        Returns:
+            tuple: (mines, flags, correct flags, treasures).
+        """
+        mine_bits = int.from_bytes(self._types.translate(_MINE_PLANE), "big")
+        correct_flags = (mine_bits & int.from_bytes(self._flagged, "big")).to_bytes(len(self._types), "big").count(1)
+        return (
+            self._types.count(CellType.MINE.value),
+            self._flagged.count(1),
+            correct_flags,
+            self._types.count(CellType.TREASURE.value),
+        )
@@ -0,0 +1,258 @@
+import csv
+import struct
+import sys
+from shared.contracts import require, ensure
+from shared.utility import Utility
+
+# Binary save layout, all integers big-endian:
+#   magic "MSB", format version (1 byte), rows, columns, elapsed seconds (4 bytes each),
+#   then 3 bit planes of the cell states, ceil(rows * columns / 8) bytes each, padded at the start.
+# Cell states are the CSV digits 0-6 (see CellType), bit k of every state goes to plane k.
+MAGIC = b"MSB"
+VERSION = 1
+HEADER = struct.Struct(">3sBIII")
+BINARY_EXTENSION = ".msb"
+CSV_EXTENSION = ".csv"
+STATE_COUNT = 7  # EMPTY to TREASURE_FLAGGED
+PLANES = 3
+
+# Most cells a loaded board may have, checked while reading so oversized files fail early
+MAX_CELLS_ENV = "MINESWEEPER_MAX_CELLS"
+DEFAULT_MAX_CELLS = 2000 * 2000
+MAX_CELLS = Utility.positive_int_from_environment(MAX_CELLS_ENV, DEFAULT_MAX_CELLS)
+TIME_HEADER = "Game Time:"
+
+# Bit k of a state as an ASCII '0' or '1', so int(..., 2) packs a whole plane in one call
+_STATE_BIT_DIGITS = [bytes(b"01"[(state >> bit) & 1] for state in range(256)) for bit in range(PLANES)]
+_DIGIT_BITS = bytes.maketrans(b"01", b"\x00\x01")
+_DIGIT_STATES = bytes.maketrans(b"0123456", bytes(range(STATE_COUNT)))
+_STATE_CHARACTERS = "0123456"
+
+
+class BinarySave:
+    """Encodes and decodes the versioned binary save format, 3 bits per cell."""
+
+    @staticmethod
+    @require(lambda path: isinstance(path, str))
+    def is_binary_path(path: str) -> bool:
+        """
+        Checks whether a save file uses the binary format, by its extension.
+
+        Args:
+            path (str): The path of the save file.
+
+        Returns:
+            bool: True for .msb files, False for CSV and anything else.
+        """
+        return path.lower().endswith(BINARY_EXTENSION)
+
+    @staticmethod
+    @require(lambda states, x_size, y_size: len(states) == x_size * y_size, "There must be one state per cell.")
+    @require(lambda x_size, y_size: x_size >= 1 and y_size >= 1, "The board must have at least one cell.")
+    @require(lambda elapsed_seconds: 0 <= elapsed_seconds < 2 ** 32, "The elapsed time must fit in 32 bits.")
+    @ensure(lambda result, states: len(result) == HEADER.size + PLANES * -(-len(states) // 8))
+    def encode(states: bytes, x_size: int, y_size: int, elapsed_seconds: int) -> bytes:
+        """
+        Packs the board into the binary format.
+
+        Args:
+            states (bytes): The saved state (0-6) of every cell, in row-major order.
+            x_size (int): The number of rows.
+            y_size (int): The number of columns.
+            elapsed_seconds (int): The elapsed game time.
+
+        Returns:
+            bytes: The encoded save.
+        """
+        plane_size = -(-len(states) // 8)
+        planes = [
+            int(states.translate(digits), 2).to_bytes(plane_size, "big") for digits in _STATE_BIT_DIGITS
+        ]
+        return HEADER.pack(MAGIC, VERSION, x_size, y_size, elapsed_seconds) + b"".join(planes)
+
+    @staticmethod
+    def read(file, max_cells: int = None):
+        """
+        Reads and decodes a binary save. The header is checked before the planes are
+        read, so oversized boards are rejected without reading them.
+
+        Args:
+            file (BinaryIO): The open save file.
+            max_cells (int): The most cells the board may have, MAX_CELLS by default.
+
+        Returns:
+            tuple: See `decode`.
+
+        Raises:
+            ValueError: If the file is not a valid binary save or the board is too large.
+        """
+        header = file.read(HEADER.size)
+        x_size, y_size, _ = BinarySave._parse_header(header, max_cells)
+        plane_size = -(-x_size * y_size // 8)
+        return BinarySave.decode(header + file.read(PLANES * plane_size + 1), max_cells)  # One extra byte detects trailing data
+
+    @staticmethod
+    def _parse_header(data: bytes, max_cells: int = None):
+        """
+        Checks the header of a binary save.
+
+        Returns:
+            tuple: (rows, columns, elapsed seconds).
+
+        Raises:
+            ValueError: If the header is invalid or the board is too large.
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("The file is too short for a binary save.")
+        magic, version, x_size, y_size, elapsed_seconds = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("The file is not a binary save.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary save version {version}, expected {VERSION}.")
+        if x_size < 1 or y_size < 1:
+            raise ValueError("The board must have at least one row and one column.")
+        limit = MAX_CELLS if max_cells is None else max_cells
+        if x_size * y_size > limit:
+            raise ValueError(f"The board has {x_size}x{y_size} cells, more than the limit of {limit}.")
+        return x_size, y_size, elapsed_seconds
+
+    @staticmethod
+    @require(lambda data: isinstance(data, (bytes, bytearray)))
+    @ensure(lambda result: len(result[3]) == result[0] * result[1])
+    def decode(data: bytes, max_cells: int = None):
+        """
+        Unpacks a binary save. Every plane is expanded and combined with whole-board
+        integer operations, without touching the cells one by one.
+
+        Args:
+            data (bytes): The encoded save.
+            max_cells (int): The most cells the board may have, MAX_CELLS by default.
+
+        Returns:
+            tuple: (rows, columns, elapsed seconds, bytearray of the cell states in row-major order).
+
+        Raises:
+            ValueError: If the data is not a valid binary save of a supported version, or the board is too large.
+        """
+        x_size, y_size, elapsed_seconds = BinarySave._parse_header(data, max_cells)
+        size = x_size * y_size
+        plane_size = -(-size // 8)
+        if len(data) != HEADER.size + PLANES * plane_size:
+            raise ValueError(f"The binary save has {len(data)} bytes, expected {HEADER.size + PLANES * plane_size}.")
+
+        combined = 0
+        for bit in range(PLANES):
+            start = HEADER.size + bit * plane_size
+            value = int.from_bytes(data[start:start + plane_size], "big")
+            if value >> size:
+                raise ValueError("The binary save has bits past the last cell.")
+            bits = format(value, f"0{size}b").encode("ascii").translate(_DIGIT_BITS)
+            combined |= int.from_bytes(bits, "big") << bit
+        states = bytearray(combined.to_bytes(size, "big"))
+        if states.count(STATE_COUNT):
+            raise ValueError(f"The binary save has an invalid cell state {STATE_COUNT}.")
+        return x_size, y_size, elapsed_seconds, states
+
+
+class CsvSave:
+    """Reads the CSV save format row by row, rejecting bad input at the first error."""
+
+    @staticmethod
+    def read(file, max_cells: int = None):
+        """
+        Reads a CSV save while checking it: the optional game time header, the width of
+        every row, the cell states and the total number of cells. Rows are decoded into
+        the state array as they are read, so nothing else is kept in memory.
+
+        Args:
+            file (TextIO): The open save file, opened with newline="".
+            max_cells (int): The most cells the board may have, MAX_CELLS by default.
+
+        Returns:
+            tuple: (rows, columns, elapsed seconds, bytearray of the cell states in row-major order).
+
+        Raises:
+            ValueError: At the first invalid line, naming its line and column (both from 1).
+        """
+        limit = MAX_CELLS if max_cells is None else max_cells
+        reader = csv.reader(file, strict=True)
+        elapsed_seconds = 0
+        states = bytearray()
+        y_size = None
+        x_size = 0
+        blank_line = None
+        try:
+            for row in reader:
+                line = reader.line_num
+                if not row:
+                    blank_line = blank_line or line  # Blank lines are only allowed at the end
+                    continue
+                if blank_line is not None:
+                    raise ValueError(f"Line {blank_line} is blank, but the board continues on line {line}.")
+                if row[0].startswith(TIME_HEADER):
+                    if line != 1 or len(row) != 1:
+                        raise ValueError(f"Line {line}: the game time header must be the only field of the first line.")
+                    elapsed_seconds = CsvSave.parse_time(row[0][len(TIME_HEADER):].strip(), line)
+                    continue
+
+                if y_size is None:
+                    y_size = len(row)
+                elif len(row) != y_size:
+                    raise ValueError(f"Line {line} has {len(row)} cells, expected {y_size} like the first board row.")
+
+                # Fast path: a row of single digits 0-6 is decoded in one translate call. With no
+                # empty field, y_size characters in y_size fields means one character per field.
+                digits = "".join(row).encode("ascii", "replace")
+                if len(digits) == y_size and "" not in row and not digits.translate(None, b"0123456"):
+                    decoded = digits.translate(_DIGIT_STATES)
+                else:
+                    decoded = bytearray()
+                    for column, value in enumerate(row, 1):
+                        state = value.strip()
+                        if len(state) != 1 or state not in _STATE_CHARACTERS:
+                            raise ValueError(
+                                f"Line {line}, column {column}: invalid cell state '{value}', expected a digit from 0 to 6."
+                            )
+                        decoded.append(ord(state) - ord("0"))
+
+                # Checked once the row is known to be valid, so a bad row is never blamed on the limit
+                if len(states) + y_size > limit:
+                    raise ValueError(f"Line {line}: the board has more than the limit of {limit} cells.")
+                states += decoded
+                x_size += 1
+        except csv.Error as e:
+            raise ValueError(f"Line {reader.line_num}: error reading CSV file: {e}")
+
+        if x_size == 0:
+            raise ValueError("The file has no board rows.")
+        return x_size, y_size, elapsed_seconds, states
+
+    @staticmethod
+    def parse_time(text: str, line: int = 1) -> int:
+        """
+        Parses the game time of a CSV save.
+
+        Args:
+            text (str): The time, as hh:mm:ss.
+            line (int): The line of the time, for the error message.
+
+        Returns:
+            int: The elapsed seconds.
+
+        Raises:
+            ValueError: If the time is not hh:mm:ss with minutes and seconds below 60.
+        """
+        parts = text.split(":")
+        if len(parts) != 3 or not all(part.isdigit() for part in parts) or int(parts[1]) >= 60 or int(parts[2]) >= 60:
+            raise ValueError(f"Line {line}: invalid game time '{text}', expected hh:mm:ss.")
+        return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("Usage (from the repository root): python -m model.save_format <source.csv|.msb> <target.csv|.msb>")
+    from model.packed_board import PackedBoard  # Imported here, model.board imports this module
+    try:
+        PackedBoard.convert_save(sys.argv[1], sys.argv[2])
+    except ValueError as e:
+        sys.exit(f"Cannot convert {sys.argv[1]}: {e}")
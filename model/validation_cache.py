@@ -0,0 +1,142 @@
+import json
+import os
+import sqlite3
+from shared.contracts import require
+
+# Environment variable with the path of the cache file, caching is off when it is unset
+CACHE_ENV = "MINESWEEPER_VALIDATION_CACHE"
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class ValidationCache:
+    """
+    Persistent cache of validation results, stored in a local SQLite file.
+
+    Entries are keyed by the layout of a board (see Board.layout_key), so the same board
+    loaded again from any file skips validation. Past `max_entries`, the least recently
+    used entries are evicted. Several processes may share one file.
+    """
+
+    @require(lambda path: isinstance(path, str) and path, "path must be a non-empty string")
+    @require(lambda max_entries: isinstance(max_entries, int) and max_entries >= 1, "max_entries must be positive")
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Opens or creates the cache file.
+
+        Args:
+            path (str): The path of the SQLite file.
+            max_entries (int): The most entries kept.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")  # Readers do not block the writer
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        self.connection.commit()
+        self.size = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def default_path():
+        """
+        Returns the cache file named by the MINESWEEPER_VALIDATION_CACHE environment variable.
+
+        Returns:
+            str | None: The path, or None if the variable is unset or empty.
+        """
+        return os.environ.get(CACHE_ENV) or None
+
+    @require(lambda key: isinstance(key, str))
+    def get(self, key: str):
+        """
+        Looks up an entry and marks it as recently used.
+
+        Args:
+            key (str): The entry key.
+
+        Returns:
+            object: The cached value, or None on a miss.
+        """
+        row = self.connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.connection.execute(
+            "UPDATE results SET used = (SELECT MAX(used) FROM results) + 1 WHERE key = ?", (key,)
+        )
+        self.connection.commit()
+        return json.loads(row[0])
+
+    @require(lambda key: isinstance(key, str))
+    @require(lambda value: value is not None, "None marks a miss and cannot be cached")
+    def put(self, key: str, value):
+        """
+        Stores an entry as the most recently used one, evicting the least recently used
+        entries past the size cap.
+
+        Args:
+            key (str): The entry key.
+            value (object): A JSON-serializable value.
+        """
+        used = "(SELECT COALESCE(MAX(used), 0) FROM results) + 1"
+        updated = self.connection.execute(
+            f"UPDATE results SET value = ?, used = {used} WHERE key = ?", (json.dumps(value), key)
+        ).rowcount
+        if not updated:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO results (key, value, used) VALUES (?, ?, {used})", (key, json.dumps(value))
+            )
+            self.size += 1
+            if self.size > self.max_entries:
+                self._evict()
+        self.connection.commit()
+
+    def _evict(self):
+        """
+        Deletes the least recently used entries past the size cap.
+        """
+        self.size = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]  # Other processes may have written
+        excess = self.size - self.max_entries
+        if excess > 0:
+            self.connection.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used LIMIT ?)", (excess,)
+            )
+            self.size -= excess
+            self.evictions += excess
+
+    def stats(self):
+        """
+        Returns the hit and miss statistics of this process.
+
+        Returns:
+            dict: hits, misses, evictions, entries (in the file) and hit_rate (0 to 1).
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.size,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """
+        Deletes every entry and resets the statistics.
+        """
+        self.connection.execute("DELETE FROM results")
+        self.connection.commit()
+        self.size = self.hits = self.misses = self.evictions = 0
+
+    def close(self):
+        """
+        Closes the cache file.
+        """
+        self.connection.close()
@@ -1,8 +1,11 @@
-from itertools import combinations
 from model.board import Board
 from model.cell import CellType
-from model.difficulty import Difficulty
-from icontract import require, ensure
+from model.difficulty import Difficulty, DIFFICULTY_TYPES
+from model.validation_cache import ValidationCache
+from shared.contracts import require, ensure
+
+# Validation rules, in the order they are checked
+RULES = ("dimensions", "mine_count", "treasure_count", "mine_positions", "mine_set")
 
 
 class Validator:
@@ -10,25 +13,78 @@ class Validator:
 
     @staticmethod
     @require(lambda board: isinstance(board, Board), "The board must be an instance of Board.")
-    @require(lambda board: hasattr(board, "dif") and isinstance(board.dif, Difficulty), "The board must have a valid difficulty.")
+    @require(lambda board: hasattr(board, "dif") and isinstance(board.dif, DIFFICULTY_TYPES), "The board must have a valid difficulty.")
+    @require(lambda cache: cache is None or isinstance(cache, ValidationCache), "The cache must be a ValidationCache or None.")
     @ensure(lambda board, result: isinstance(result, bool), "The result must be a boolean value.")
-    def validate_board(board: Board) -> bool:
+    def validate_board(board: Board, cache: ValidationCache = None) -> bool:
         """
-        Validates the Minesweeper board for the current difficulty.
+        Validates the Minesweeper board for the current difficulty, printing the rule it breaks.
 
         Args:
             board (Board): The game board to validate.
+            cache (ValidationCache): Cache of earlier results, see `find_violation`.
 
         Returns:
             bool: True if the board is valid, False otherwise.
         """
+        violation = Validator.find_violation(board, cache)
+        if violation is not None:
+            print(violation[1])
+            return False
+        return True
+
+    @staticmethod
+    @require(lambda board: isinstance(board, Board), "The board must be an instance of Board.")
+    @require(lambda board: hasattr(board, "dif") and isinstance(board.dif, DIFFICULTY_TYPES), "The board must have a valid difficulty.")
+    @require(lambda cache: cache is None or isinstance(cache, ValidationCache), "The cache must be a ValidationCache or None.")
+    @ensure(lambda result: result is None or result[0] in RULES, "The result must name one of the rules.")
+    def find_violation(board: Board, cache: ValidationCache = None):
+        """
+        Finds the first validation rule the board breaks.
+
+        Args:
+            board (Board): The game board to validate.
+            cache (ValidationCache): If given, the result is looked up by the board layout
+                and difficulty first, and stored after a miss.
+
+        Returns:
+            tuple[str, str] | None: The rule, one of RULES, and a message explaining the
+                failure, or None if the board is valid.
+        """
+        if cache is None:
+            return Validator._check_rules(board)
+
+        key = f"{board.layout_key()}/{Validator._difficulty_key(board.dif)}"
+        cached = cache.get(key)
+        if cached is not None:
+            return tuple(cached) if cached else None
+        violation = Validator._check_rules(board)
+        cache.put(key, list(violation) if violation else [])
+        return violation
+
+    @staticmethod
+    def _difficulty_key(difficulty):
+        """
+        Returns the part of the cache key that identifies the difficulty rules.
+        """
+        if isinstance(difficulty, Difficulty):
+            return difficulty.name
+        return "CUSTOM:" + ",".join(str(value) for value in (
+            difficulty.x_size, difficulty.y_size, difficulty.max_mines, difficulty.min_mines,
+            difficulty.max_treasures, difficulty.min_treasures,
+        ))
+
+    @staticmethod
+    def _check_rules(board: Board):
+        """
+        Checks the rules in order, see `find_violation`.
+        """
         tiles = board.tiles
         difficulty = board.dif
 
         # Ensure the board dimensions match the difficulty
         if len(tiles) != difficulty.x_size or not all(len(row) == difficulty.y_size for row in tiles):
-            print(f"Invalid board dimensions. Expected {difficulty.x_size}x{difficulty.y_size}.")
-            return False
+            return "dimensions", f"Invalid board dimensions. Expected {difficulty.x_size}x{difficulty.y_size}."
 
         # Count mines and treasures
         mine_count = sum(cell.type == CellType.MINE for row in tiles for cell in row)
@@ -36,11 +92,13 @@ class Validator:
 
         # Validation rules
         if not (difficulty.min_mines <= mine_count <= difficulty.max_mines):
-            print(f"Invalid number of mines. Expected between {difficulty.min_mines} and {difficulty.max_mines}, but found {mine_count}.")
-            return False
+            return "mine_count", (
+                f"Invalid number of mines. Expected between {difficulty.min_mines} and {difficulty.max_mines}, but found {mine_count}."
+            )
         if not (difficulty.min_treasures <= treasure_count <= difficulty.max_treasures):
-            print(f"Invalid number of treasures. Expected between {difficulty.min_treasures} and {difficulty.max_treasures}, but found {treasure_count}.")
-            return False
+            return "treasure_count", (
+                f"Invalid number of treasures. Expected between {difficulty.min_treasures} and {difficulty.max_treasures}, but found {treasure_count}."
+            )
 
         # Gather mine positions
         mine_positions = [
@@ -48,54 +106,171 @@ class Validator:
         ]
 
         if len(mine_positions) != mine_count:
-            print(f"Unexpected number of mines in positions list. Expected {mine_count}, but found {len(mine_positions)}.")
+            return "mine_positions", (
+                f"Unexpected number of mines in positions list. Expected {mine_count}, but found {len(mine_positions)}."
+            )
+
+        # Search for a set of min_mines mines that satisfies the constraints
+        if not Validator._find_mine_set(mine_positions, difficulty.min_mines):
+            return "mine_set", f"No valid combination of {difficulty.min_mines} mines satisfies the constraints."
+        return None
+
+    @staticmethod
+    def _find_mine_set(mines: list, size: int) -> bool:
+        """
+        Checks whether `size` of the mines form a valid set, in the sense of the original
+        combinations() scan over the mines in row-major order:
+
+        - the set uses every row and every column at most once (so no two of its mines are
+          cardinally adjacent),
+        - at least one of its mines is on the diagonal (row == column),
+        - the first mine left out of the set is cardinally adjacent to one of its mines,
+        - when exactly two mines are left out, the second one is not cardinally adjacent to
+          the set or to the first one left out.
+
+        The first mine left out decides which mines precede it, so the search tries each
+        of them in turn. Every mine before it is in the set, and sets that repeat a row or
+        column there are pruned as a whole. With at most two mines left out, the set is then
+        fixed or has one choice per remaining mine. Otherwise, a diagonal mine and a
+        neighbor of the first left-out mine are picked when the forced part has none, and a
+        bipartite matching between free rows and columns completes the set.
+
+        Args:
+            mines (list[tuple[int, int]]): The mine positions in row-major order.
+            size (int): The number of mines in the set.
+
+        Returns:
+            bool: True if a valid set exists.
+        """
+        left_out = len(mines) - size
+        if left_out < 0 or size > len({r for r, _ in mines}) or size > len({c for _, c in mines}):
             return False
+        if left_out == 0:
+            return Validator._is_valid_set(mines, None, None)
 
-        # Check all combinations of 8 mines for unique rows/columns and other constraints
-        for combination in combinations(mine_positions, difficulty.min_mines):
-            rows = {r for r, _ in combination}
-            cols = {c for _, c in combination}
-
-            # Ensure unique rows and columns
-            if len(rows) != difficulty.min_mines or len(cols) != difficulty.min_mines:
-                continue
-
-            # Ensure no adjacent mines (cardinal directions only) within this combination
-            if any(
-                (r + dr, c + dc) in combination
-                for r, c in combination
-                for dr, dc in [(0, -1), (0, 1), (-1, 0), (1, 0)]
-            ):
-                continue
-
-            # Ensure at least one mine is on the diagonal (row == col)
-            if not any(r == c for r, c in combination):
-                continue
-
-            # Validate remaining mines
-            remaining_mines = [pos for pos in mine_positions if pos not in combination]
-
-            # Ninth mine must be adjacent to one of the valid 8 mines
-            if len(remaining_mines) >= 1:
-                r9, c9 = remaining_mines[0]
-                if not any(
-                    (abs(r9 - r) == 1 and c9 == c) or (r9 == r and abs(c9 - c) == 1)
-                    for r, c in combination
-                ):
-                    continue
+        rows, columns = set(), set()
+        for first in range(min(size, len(mines) - 1) + 1):
+            if first:
+                r, c = mines[first - 1]
+                if r in rows or c in columns:
+                    return False  # Every later split also contains this repeated row or column
+                rows.add(r)
+                columns.add(c)
 
-            # Tenth mine must be isolated from the first 9 mines
-            if len(remaining_mines) == 2:
-                r10, c10 = remaining_mines[1]
-                if any(
-                    abs(r10 - r) + abs(c10 - c) == 1
-                    for r, c in combination + [remaining_mines[0]]
-                ):
-                    continue
+            forced, first_out, rest = mines[:first], mines[first], mines[first + 1:]
+            if left_out == 1:
+                if Validator._is_valid_set(forced + rest, first_out, None):
+                    return True
+            elif left_out == 2:
+                for index, second_out in enumerate(rest):
+                    if Validator._is_valid_set(forced + rest[:index] + rest[index + 1:], first_out, second_out):
+                        return True
+            elif Validator._complete_set(forced, first_out, rest, size, rows, columns):
+                return True
+        return False
 
-            # If a valid combination is found, the board is valid
-            return True
+    @staticmethod
+    def _complete_set(forced: list, first_out: tuple, rest: list, size: int, rows: set, columns: set) -> bool:
+        """
+        Checks whether mines from `rest` complete the forced mines into a valid set, when
+        more than two mines are left out.
+
+        Args:
+            forced (list[tuple[int, int]]): Mines that are in the set, on distinct rows and columns.
+            first_out (tuple[int, int]): The first mine left out of the set.
+            rest (list[tuple[int, int]]): The mines after it, any of which may join the set.
+            size (int): The number of mines in the set.
+            rows (set[int]): The rows of the forced mines.
+            columns (set[int]): The columns of the forced mines.
 
-        # If no valid combination is found, the board is invalid
-        print("No valid combination of 8 mines satisfies the constraints.")
+        Returns:
+            bool: True if a valid set exists.
+        """
+        # A forced mine may already satisfy the diagonal or the adjacency rule, otherwise try every candidate
+        diagonal = [None] if any(r == c for r, c in forced) else [(r, c) for r, c in rest if r == c]
+        touching = (
+            [None] if any(Validator._adjacent(first_out, mine) for mine in forced)
+            else [mine for mine in rest if Validator._adjacent(first_out, mine)]
+        )
+        for diagonal_mine in diagonal:
+            for touching_mine in touching:
+                picked = {mine for mine in (diagonal_mine, touching_mine) if mine is not None}
+                picked_rows = {r for r, _ in picked}
+                picked_columns = {c for _, c in picked}
+                if len(picked_rows) != len(picked) or len(picked_columns) != len(picked):
+                    continue  # The two picks share a row or column
+                if picked_rows & rows or picked_columns & columns:
+                    continue
+                needed = size - len(forced) - len(picked)
+                if needed < 0:
+                    continue
+                used_rows, used_columns = rows | picked_rows, columns | picked_columns
+                free = [(r, c) for r, c in rest if r not in used_rows and c not in used_columns]
+                if Validator._max_matching(free, needed) >= needed:
+                    return True
         return False
+
+    @staticmethod
+    def _max_matching(mines: list, target: int) -> int:
+        """
+        Finds how many of the mines can be picked with every row and column at most once,
+        stopping early once `target` is reached.
+
+        Args:
+            mines (list[tuple[int, int]]): The candidate mines, as (row, column) edges.
+            target (int): The number of mines that is enough.
+
+        Returns:
+            int: The size of the largest such pick, or at least `target`.
+        """
+        columns_by_row = {}
+        for r, c in mines:
+            columns_by_row.setdefault(r, []).append(c)
+        row_of_column = {}
+
+        def augment(r, seen):
+            for c in columns_by_row[r]:
+                if c not in seen:
+                    seen.add(c)
+                    if c not in row_of_column or augment(row_of_column[c], seen):
+                        row_of_column[c] = r
+                        return True
+            return False
+
+        matched = 0
+        for r in columns_by_row:
+            if matched >= target:
+                break
+            if augment(r, set()):
+                matched += 1
+        return matched
+
+    @staticmethod
+    def _is_valid_set(chosen: list, first_out: tuple, second_out: tuple) -> bool:
+        """
+        Checks a fixed set of mines against the rules of `_find_mine_set`.
+
+        Args:
+            chosen (list[tuple[int, int]]): The mines in the set.
+            first_out (tuple[int, int]): The first mine left out, or None.
+            second_out (tuple[int, int]): The second mine left out when exactly two are, or None.
+
+        Returns:
+            bool: True if the set is valid.
+        """
+        if len({r for r, _ in chosen}) != len(chosen) or len({c for _, c in chosen}) != len(chosen):
+            return False
+        if not any(r == c for r, c in chosen):
+            return False
+        if first_out is not None and not any(Validator._adjacent(first_out, mine) for mine in chosen):
+            return False
+        if second_out is not None and any(Validator._adjacent(second_out, mine) for mine in chosen + [first_out]):
+            return False
+        return True
+
+    @staticmethod
+    def _adjacent(a: tuple, b: tuple) -> bool:
+        """
+        Checks whether two cells are cardinally adjacent.
+        """
+        return abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
@@ -1,7 +1,18 @@
 import argparse
-from model.difficulty import Difficulty
+import os
+import sys
+
+from shared.contract_level import LEVELS, LEVEL_ENV, configure_contracts
+
+configure_contracts()
+
+from model.board import Board, SafeZone
+from model.difficulty import Difficulty, CustomDifficulty
+from model.packed_board import PackedBoard
 from view.tkinter.tkinter_view import TkinterViewer
+from view.tkinter.canvas_view import CanvasViewer
 from view.text.text_view import TextView
+from model.validation_cache import ValidationCache, CACHE_ENV
 from controller.controller import Controller
 
 
@@ -9,9 +20,15 @@ def main():
     """
     Entry point for the Minesweeper program.
     Usage:
-        python run.py <difficulty> <viewer> [--testing-mode]
+        python run.py <difficulty> <viewer> [--testing-mode] [--engine cells|packed] [--safe-zone none|cell|area]
+                      [--contracts full|cheap|off] [--seed N] [--max-fps N] [--plain]
+                      [--script FILE|- [--frame-every N] [--restart yes|no]] [--validation-cache FILE]
+                      [--rows N --columns N [--mines N] [--treasures N]]
         Example:
         python run.py BEGINNER tkinter --testing-mode
+        python run.py CUSTOM text --rows 500 --columns 500 --mines 40000 --engine packed
+        python run.py EXPERT tkinter --contracts off
+        python run.py EXPERT text --seed 7 --script moves.txt --contracts off
     """
 
     # Supported difficulties and viewers
@@ -19,41 +36,137 @@ def main():
         "BEGINNER": Difficulty.BEGINNER,
         "INTERMEDIATE": Difficulty.INTERMEDIATE,
         "EXPERT": Difficulty.EXPERT,
+        "CUSTOM": None,  # Built from --rows, --columns, --mines and --treasures
     }
 
     viewers = {
         "tkinter": TkinterViewer,
+        "canvas": CanvasViewer,
         "text": TextView,
     }
 
+    engines = {
+        "cells": Board,
+        "packed": PackedBoard,
+    }
+
+    safe_zones = {
+        "none": None,
+        "cell": SafeZone.CELL,
+        "area": SafeZone.AREA,
+    }
+
     # Set up argument parser
     parser = argparse.ArgumentParser(description="Run Minesweeper with specified settings.")
     parser.add_argument(
         "difficulty",
         choices=difficulties.keys(),
-        help="Select the difficulty level: BEGINNER, INTERMEDIATE, EXPERT",
+        help="Select the difficulty level: BEGINNER, INTERMEDIATE, EXPERT or CUSTOM",
     )
     parser.add_argument(
         "viewer",
         choices=viewers.keys(),
-        help="Select the viewer type: tkinter or text",
+        help="Select the viewer type: tkinter, canvas (Tkinter, one canvas for large boards) or text",
     )
     parser.add_argument(
         "--testing-mode",
         action="store_true",
         help="Enable testing mode to load a predefined board.",
     )
+    parser.add_argument(
+        "--engine",
+        choices=engines.keys(),
+        default="cells",
+        help="Select the board engine: cells (one Cell object per tile) or packed (array-backed, for large boards)",
+    )
+    parser.add_argument(
+        "--safe-zone",
+        choices=safe_zones.keys(),
+        default="none",
+        help="Defer mine placement to the first click and keep the clicked cell (cell) or its 3x3 area (area) clear",
+    )
+    parser.add_argument(
+        "--contracts",
+        choices=LEVELS,
+        default=os.environ.get(LEVEL_ENV, "full"),
+        help="Contract checking level: full (default), cheap (skip whole-board checks) or off",
+    )
+    parser.add_argument(
+        "--max-fps",
+        type=int,
+        default=60,
+        help="tkinter and canvas only: most board repaints per second, 0 repaints whenever Tk is idle.",
+    )
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="text only: print the whole board after every move instead of redrawing changed cells in place.",
+    )
+    parser.add_argument(
+        "--script",
+        help="text only: apply the commands of a file (- for stdin) back to back instead of prompting, then print a summary.",
+    )
+    parser.add_argument(
+        "--frame-every",
+        type=int,
+        default=0,
+        help="--script only: print every Nth board, 0 (default) prints only the final board.",
+    )
+    parser.add_argument(
+        "--restart",
+        choices=["yes", "no"],
+        default="no",
+        help="--script only: answer to the play again prompt at the end of each game (default no).",
+    )
+    parser.add_argument(
+        "--validation-cache",
+        default=ValidationCache.default_path(),
+        help=f"--testing-mode: SQLite file that caches validation results by board layout (default: ${CACHE_ENV}).",
+    )
+    parser.add_argument("--seed", type=int, help="Seed the mine and treasure placement for reproducible games.")
+    parser.add_argument("--rows", type=int, help="CUSTOM only: number of rows on the board.")
+    parser.add_argument("--columns", type=int, help="CUSTOM only: number of columns on the board.")
+    parser.add_argument("--mines", type=int, help="CUSTOM only: number of mines, defaults to 15%% of the cells.")
+    parser.add_argument("--treasures", type=int, help="CUSTOM only: number of treasures, defaults to 2.")
 
     # Parse arguments
     args = parser.parse_args()
 
     # Get difficulty and viewer
     difficulty = difficulties[args.difficulty.upper()]
+    if difficulty is None:
+        if not args.rows or not args.columns or args.rows < 1 or args.columns < 1:
+            parser.error("CUSTOM difficulty requires positive --rows and --columns.")
+        cells = args.rows * args.columns
+        mines = args.mines if args.mines is not None else max(cells * 15 // 100, 1)
+        treasures = args.treasures if args.treasures is not None else min(2, mines - 1)
+        if not 0 <= treasures < mines or mines + treasures > cells:
+            parser.error("CUSTOM difficulty needs fewer treasures than mines, and both must fit on the board.")
+        difficulty = CustomDifficulty(args.rows, args.columns, mines, mines, treasures, treasures)
     viewer_class = viewers[args.viewer.lower()]
 
+    if args.max_fps < 0:
+        parser.error("--max-fps must not be negative.")
+    if args.frame_every < 0:
+        parser.error("--frame-every must not be negative.")
+    if args.script is not None and viewer_class is not TextView:
+        parser.error("--script requires the text viewer.")
+
     # Initialize the viewer and controller
-    viewer = viewer_class()
-    controller = Controller(viewer)
+    if issubclass(viewer_class, TkinterViewer):
+        viewer = viewer_class(args.max_fps)
+    else:
+        script = None
+        if args.script == "-":
+            script = sys.stdin
+        elif args.script is not None:
+            try:
+                script = open(args.script)
+            except OSError as e:
+                parser.error(f"Cannot read the script: {e}")
+        viewer = viewer_class(False if args.plain else None, script, args.frame_every, args.restart == "yes")
+    cache = ValidationCache(args.validation_cache) if args.validation_cache else None
+    controller = Controller(viewer, engines[args.engine], safe_zones[args.safe_zone], args.seed, cache)
     viewer.controller = controller
 
     # Set the difficulty and optionally enable testing mode
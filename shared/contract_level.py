@@ -0,0 +1,21 @@
+import argparse
+import os
+
+# Environment variable holding the contract level, see shared.contracts
+LEVEL_ENV = "MINESWEEPER_CONTRACTS"
+LEVELS = ("full", "cheap", "off")
+
+
+def configure_contracts():
+    """
+    Applies a --contracts command line option before the model is imported, since the
+    contract level is read once when shared.contracts is first imported. Worker
+    processes inherit it through the environment.
+
+    This module must not import shared.contracts, or the level would be read too early.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--contracts", choices=LEVELS)
+    args, _ = parser.parse_known_args()
+    if args.contracts:
+        os.environ[LEVEL_ENV] = args.contracts
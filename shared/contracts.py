@@ -0,0 +1,47 @@
+import os
+import icontract
+from icontract import SLOW, ViolationError
+from shared.contract_level import LEVELS, LEVEL_ENV
+
+# SLOW and ViolationError are re-exported so callers need only this module
+__all__ = ["require", "ensure", "invariant", "SLOW", "ViolationError", "LEVEL", "LEVELS", "FULL", "ENABLED"]
+
+# Contract level, read once at import time:
+#   full  - every contract is checked (default, used for development and testing)
+#   cheap - only constant-time argument and state checks; contracts marked
+#           enabled=FULL (whole-board scans, board validation, class invariants) are skipped
+#   off   - no contract is checked and the decorated functions are left unwrapped
+LEVEL = os.environ.get(LEVEL_ENV, "full").strip().lower()
+if LEVEL not in LEVELS:
+    raise ValueError(f"{LEVEL_ENV} must be one of {', '.join(LEVELS)}, got '{LEVEL}'.")
+
+FULL = LEVEL == "full"
+ENABLED = LEVEL != "off"
+
+
+def _skip(target):
+    """
+    Returns the decorated function or class unchanged.
+    """
+    return target
+
+
+def require(*args, **kwargs):
+    """
+    icontract.require that is dropped entirely when contracts are off.
+    """
+    return icontract.require(*args, **kwargs) if ENABLED else _skip
+
+
+def ensure(*args, **kwargs):
+    """
+    icontract.ensure that is dropped entirely when contracts are off.
+    """
+    return icontract.ensure(*args, **kwargs) if ENABLED else _skip
+
+
+def invariant(*args, **kwargs):
+    """
+    icontract.invariant that is dropped entirely when contracts are off.
+    """
+    return icontract.invariant(*args, **kwargs) if ENABLED else _skip
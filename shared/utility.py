@@ -1,63 +1,169 @@
+import os
 import random
-from icontract import require, ensure
+import sys
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from shared.contracts import require, ensure, FULL
 
 
 class Utility:
     """Utility class containing helper methods for the Minesweeper game."""
 
     @staticmethod
-    @require(
-        lambda array_shape: isinstance(array_shape, tuple) and len(array_shape) == 2 and all(isinstance(dim, int) and dim > 0 for dim in array_shape),
-        "array_shape must be a tuple of two positive integers"
-    )
-    @require(lambda min_values, max_values: min_values >= 0 and max_values >= 0, "min_values and max_values must be non-negative")
-    @require(lambda min_values, max_values: min_values <= max_values, "min_values cannot be greater than max_values")
-    @require(lambda array_shape, max_values: max_values <= array_shape[0] * array_shape[1],
-             "max_values cannot exceed the total number of cells")
-    @ensure(
-        lambda result, array_shape: len(result) == array_shape[0] and all(len(row) == array_shape[1] for row in result),
-        "The returned array must match the specified array_shape"
-    )
-    @ensure(
-        lambda result, value, min_values, max_values: min_values <= sum(cell == value for row in result for cell in row) <= max_values,
-        "The number of distributed values must be between min_values and max_values"
-    )
-    def randomly_distribute_values_2d(array_shape, min_values, max_values, value=1):
-        """
-        Randomly distribute a specified value in a 2D array, ensuring the count of distributed values
-        is between min_values and max_values.
+    @require(lambda name, default: isinstance(name, str) and isinstance(default, int) and default > 0)
+    @ensure(lambda result: result > 0, "The result must be positive")
+    def positive_int_from_environment(name, default):
+        """
+        Read a positive integer setting from an environment variable.
+
+        An unset or empty variable gives the default. An invalid value is reported on
+        stderr and also gives the default, so a typo cannot stop every entry point.
+
+        Parameters:
+        - name (str): The environment variable.
+        - default (int): The value to use when the variable is unset or invalid.
+
+        Returns:
+        - int: The setting.
+        """
+        text = os.environ.get(name, "").strip()
+        if not text:
+            return default
+        try:
+            value = int(text)
+        except ValueError:
+            value = 0
+        if value < 1:
+            print(f"Warning: {name} must be a positive integer, got '{text}'. Using {default}.", file=sys.stderr)
+            return default
+        return value
+
+    @staticmethod
+    @require(lambda cell_count, mine_count, treasure_count: cell_count >= 0 and mine_count >= 0 and treasure_count >= 0,
+             "cell_count, mine_count and treasure_count must be non-negative")
+    @require(lambda cell_count, mine_count, treasure_count, excluded: mine_count + treasure_count <= cell_count - len(excluded),
+             "The items must fit in the cells that are not excluded")
+    @ensure(lambda result, mine_count, treasure_count: len(result[0]) == mine_count and len(result[1]) == treasure_count,
+            "Exactly mine_count mines and treasure_count treasures must be placed")
+    @ensure(lambda result, excluded: not set(result[0]) & set(result[1]) and not set(excluded) & set(result[0] + result[1]),
+            "Mines and treasures must not overlap each other or the excluded cells", enabled=FULL)
+    def sample_items(cell_count, mine_count, treasure_count, rng=None, excluded=()):
+        """
+        Draw distinct flat cell indices for mines and treasures in a single joint sample.
+
+        Mines and treasures come from one sample, so they can never overlap. Excluded
+        cells are handled by oversampling by their count and dropping them, which keeps
+        the remaining order uniform. The cost is O(items + excluded), not O(cells).
 
         Parameters:
-        - array_shape (tuple): Dimensions of the array (rows, columns).
-        - min_values (int): Minimum number of values to distribute in the array.
-        - max_values (int): Maximum number of values to distribute in the array.
-        - value (int or float): The value to be distributed. Default is 1.
+        - cell_count (int): The number of cells on the board.
+        - mine_count (int): The number of mines to place.
+        - treasure_count (int): The number of treasures to place.
+        - rng (random.Random, int or None): Random generator, or a seed for a new one. Default uses the global generator.
+        - excluded (collection of int): Flat indices that must stay empty. Default is none.
 
         Returns:
-        - list of lists: A 2D array with the values randomly distributed.
+        - tuple: (mines, treasures), two lists of flat indices.
+        """
+        if rng is None:
+            rng = random
+        elif not isinstance(rng, random.Random):
+            rng = random.Random(rng)
 
-        Raises:
-        - ValueError: If constraints on min_values, max_values, or array dimensions are violated.
+        item_count = mine_count + treasure_count
+        indices = rng.sample(range(cell_count), item_count + len(excluded))
+        if excluded:
+            blocked = set(excluded)
+            indices = [index for index in indices if index not in blocked][:item_count]
+        return indices[:mine_count], indices[mine_count:]
+
+    @staticmethod
+    @require(lambda rank: isinstance(rank, int) and rank >= 0, "rank must be a non-negative integer")
+    @ensure(lambda result, taken: result not in taken, "The returned index must not be taken", enabled=FULL)
+    def nth_free_index(rank, taken):
         """
-        rows, cols = array_shape
+        Find the rank-th (0-based) non-negative integer that is not in a sorted list of taken indices.
 
-        # Initialize a 2D array of zeros
-        array = [[0 for _ in range(cols)] for _ in range(rows)]
+        The answer is rank plus the number of taken indices before it, so it is found by
+        repeatedly bisecting the taken list. This costs O(log k) per step for k taken
+        indices, independent of how large the indices are.
 
-        # Flatten the 2D array indices into a list
-        all_indices = [(i, j) for i in range(rows) for j in range(cols)]
+        Parameters:
+        - rank (int): The position of the wanted index among the free indices.
+        - taken (list of int): Sorted taken indices.
+
+        Returns:
+        - int: The rank-th free index.
+        """
+        index = rank
+        while (shifted := rank + bisect_right(taken, index)) != index:
+            index = shifted
+        return index
 
-        # Ensure the minimum number of values are distributed
-        min_indices = random.sample(all_indices, k=min_values)
-        for i, j in min_indices:
-            array[i][j] = value
+    @staticmethod
+    @require(lambda x_size, y_size: x_size > 0 and y_size > 0, "Board dimensions must be positive")
+    @lru_cache(maxsize=16)
+    def neighbor_table(x_size, y_size):
+        """
+        Build the neighbor table of a board shape in CSR (compressed sparse row) form.
+
+        The neighbors of the cell with flat index i = x * y_size + y are
+        indices[offsets[i]:offsets[i + 1]]. Tables are cached per shape and shared
+        by every board of that shape, so both are read-only memoryviews whose
+        slices are views rather than copies.
+
+        Parameters:
+        - x_size (int): The number of rows.
+        - y_size (int): The number of columns.
+
+        Returns:
+        - tuple: (offsets, indices), read-only memoryviews over arrays of ints.
+        """
+        offsets = array("i", [0])
+        indices = array("i")
+        for x in range(x_size):
+            rows = range(max(x - 1, 0), min(x + 2, x_size))
+            for y in range(y_size):
+                indices.extend(
+                    nx * y_size + ny
+                    for nx in rows
+                    for ny in range(max(y - 1, 0), min(y + 2, y_size))
+                    if nx != x or ny != y
+                )
+                offsets.append(len(indices))
+        return memoryview(offsets).toreadonly(), memoryview(indices).toreadonly()
+
+    @staticmethod
+    @require(lambda plane, x_size, y_size: x_size > 0 and y_size > 0 and len(plane) == x_size * y_size,
+             "The plane must have one byte per cell of a non-empty board")
+    def neighbor_sums(plane, x_size, y_size):
+        """
+        Sum the 3x3 neighborhood of every cell of a 0/1 plane, excluding the cell itself.
+
+        The plane is treated as one big-endian integer with a byte per cell, so each
+        shift moves every cell by one position at once. Sums never exceed 8, so no
+        carries cross cell boundaries.
+
+        Parameters:
+        - plane (bytes): One byte per cell in row-major order, 1 where the counted item is present.
+        - x_size (int): The number of rows.
+        - y_size (int): The number of columns.
+
+        Returns:
+        - bytes: One byte per cell holding the neighbor count.
+        """
+        size = x_size * y_size
+        full = (1 << (8 * size)) - 1
 
-        # Distribute the remaining values to satisfy the maximum constraint
-        remaining_values = max_values - min_values
-        if remaining_values > 0:
-            available_indices = [idx for idx in all_indices if array[idx[0]][idx[1]] == 0]
-            additional_indices = random.sample(available_indices, k=remaining_values)
-            for i, j in additional_indices:
-                array[i][j] = value
+        # Masks clearing values that would wrap around into the neighboring row
+        not_first = bytearray(b"\xff" * size)
+        not_first[0::y_size] = bytes(x_size)
+        not_last = bytearray(b"\xff" * size)
+        not_last[y_size - 1::y_size] = bytes(x_size)
 
-        return array
+        cells = int.from_bytes(plane, "big")
+        rows = cells + ((cells >> 8) & int.from_bytes(not_first, "big")) + ((cells << 8) & int.from_bytes(not_last, "big"))
+        shift = 8 * y_size
+        boxes = rows + (rows >> shift) + ((rows << shift) & full)
+        return (boxes - cells).to_bytes(size, "big")
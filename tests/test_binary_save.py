@@ -0,0 +1,116 @@
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from model.board import Board
+from model.difficulty import Difficulty
+from model.packed_board import PackedBoard
+from model.save_format import BinarySave, HEADER, MAGIC, VERSION
+
+ROOT = Path(__file__).resolve().parent.parent
+ENGINES = [Board, PackedBoard]
+
+# valid.csv with every saved state 0-6 and a game time
+SAVE = """Game Time: 00:02:05
+3,0,6,2,4,5,5,0
+0,0,0,0,1,0,0,0
+0,0,0,0,0,0,0,1
+0,0,0,0,0,1,0,1
+0,0,1,0,0,0,0,0
+0,0,0,0,0,0,1,0
+0,1,0,0,0,0,0,0
+0,0,0,1,0,0,1,0
+"""
+
+
+@pytest.fixture
+def csv_save(tmp_path):
+    path = tmp_path / "board.csv"
+    path.write_text(SAVE)
+    return path
+
+
+def load(engine, path):
+    board = engine(Difficulty.BEGINNER)
+    board.load_board(str(path))
+    return board
+
+
+@pytest.mark.parametrize("saver", ENGINES)
+@pytest.mark.parametrize("loader", ENGINES)
+def test_csv_to_binary_and_back_is_lossless(tmp_path, csv_save, saver, loader):
+    binary = tmp_path / "board.msb"
+    load(saver, csv_save).save_board(str(binary))
+    board = load(loader, binary)
+    board.save_board(str(tmp_path / "again.csv"))
+
+    assert binary.stat().st_size == HEADER.size + 3 * 8
+    assert (tmp_path / "again.csv").read_text().replace("\r\n", "\n") == SAVE
+    assert board._state_bytes() == load(saver, csv_save)._state_bytes()
+    assert board.dif == Difficulty.BEGINNER
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_played_board_round_trips(tmp_path, engine):
+    board = engine(Difficulty.INTERMEDIATE, rng=4)
+    board.reveal_cell(0, 0)
+    board.toggle_flag(15, 15)
+    board.save_board(str(tmp_path / "played.msb"))
+
+    assert load(engine, tmp_path / "played.msb")._state_bytes() == board._state_bytes()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_encode_decode(seed):
+    rng = random.Random(seed)
+    x_size, y_size = rng.randint(1, 40), rng.randint(1, 40)
+    states = bytes(rng.randrange(7) for _ in range(x_size * y_size))
+    data = BinarySave.encode(states, x_size, y_size, 3661)
+
+    assert BinarySave.decode(data) == (x_size, y_size, 3661, bytearray(states))
+    padding = -len(states) % 8
+    assert data[HEADER.size] >> (8 - padding) == 0  # The padding bits start the first plane
+
+
+def test_decode_rejects_bad_data():
+    data = BinarySave.encode(bytes([1, 2, 3]), 1, 3, 0)
+
+    with pytest.raises(ValueError, match="too short"):
+        BinarySave.decode(data[:5])
+    with pytest.raises(ValueError, match="not a binary save"):
+        BinarySave.decode(b"XYZ" + data[3:])
+    with pytest.raises(ValueError, match="version"):
+        BinarySave.decode(HEADER.pack(MAGIC, VERSION + 1, 1, 3, 0) + data[HEADER.size:])
+    with pytest.raises(ValueError, match="bytes, expected"):
+        BinarySave.decode(data + b"\0")
+    with pytest.raises(ValueError, match="past the last cell"):
+        BinarySave.decode(data[:HEADER.size] + b"\xff" + data[HEADER.size + 1:])
+    with pytest.raises(ValueError, match="invalid cell state 7"):
+        BinarySave.decode(HEADER.pack(MAGIC, VERSION, 1, 1, 0) + b"\x01\x01\x01")
+
+
+def run_converter(*args):
+    return subprocess.run(
+        [sys.executable, "-m", "model.save_format", *args], capture_output=True, text=True, cwd=ROOT, timeout=60,
+    )
+
+
+def test_converter(tmp_path, csv_save):
+    binary, back = tmp_path / "board.msb", tmp_path / "back.csv"
+
+    assert run_converter(str(csv_save), str(binary)).returncode == 0
+    assert run_converter(str(binary), str(back)).returncode == 0
+    assert back.read_text().replace("\r\n", "\n") == SAVE
+
+
+def test_converter_reports_bad_sources(tmp_path):
+    bad = tmp_path / "bad.csv"
+    bad.write_text("0,9\n")
+    result = run_converter(str(bad), str(tmp_path / "bad.msb"))
+
+    assert result.returncode == 1
+    assert result.stderr.startswith(f"Cannot convert {bad}: Line 1, column 2")
+    assert run_converter().returncode == 1
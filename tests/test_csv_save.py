@@ -0,0 +1,117 @@
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from model.board import Board
+from model.difficulty import Difficulty
+from model.packed_board import PackedBoard
+from model.save_format import CsvSave, MAX_CELLS_ENV, DEFAULT_MAX_CELLS
+from shared.utility import Utility
+
+ROOT = Path(__file__).resolve().parent.parent
+ENGINES = [Board, PackedBoard]
+
+
+def read(text, max_cells=None):
+    return CsvSave.read(io.StringIO(text, newline=""), max_cells)
+
+
+def test_reads_states_and_time():
+    assert read("Game Time: 01:02:03\n0,1,2\n3,4,5\n6,0,0\n") == (3, 3, 3723, bytearray([0, 1, 2, 3, 4, 5, 6, 0, 0]))
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("0,1\n1,0\n", (2, 2, 0, bytearray([0, 1, 1, 0]))),  # No time header
+    ("0, 1\n 1,0\r\n", (2, 2, 0, bytearray([0, 1, 1, 0]))),  # Spaces and CRLF
+    ("0,1\n\n\n", (1, 2, 0, bytearray([0, 1]))),  # Blank lines at the end
+])
+def test_accepted_variants(text, expected):
+    assert read(text) == expected
+
+
+@pytest.mark.parametrize("text, message", [
+    ("", "The file has no board rows."),
+    ("Game Time: 00:00:01\n", "The file has no board rows."),
+    ("0,1,0\n0,0\n", "Line 2 has 2 cells, expected 3 like the first board row."),
+    ("0,1,0\n0,7,0\n", "Line 2, column 2: invalid cell state '7', expected a digit from 0 to 6."),
+    ("0,1\nx,0\n", "Line 2, column 1: invalid cell state 'x', expected a digit from 0 to 6."),
+    ("12,\n0,0\n", "Line 1, column 1: invalid cell state '12', expected a digit from 0 to 6."),
+    (",12\n0,0\n", "Line 1, column 1: invalid cell state '', expected a digit from 0 to 6."),
+    ("0,-1\n0,0\n", "Line 1, column 2: invalid cell state '-1', expected a digit from 0 to 6."),
+    ("Game Time: 1:99:00\n0,1\n", "Line 1: invalid game time '1:99:00', expected hh:mm:ss."),
+    ("Game Time: 00:00:01,3\n0,1\n", "Line 1: the game time header must be the only field of the first line."),
+    ("0,1\nGame Time: 00:00:01\n", "Line 2: the game time header must be the only field of the first line."),
+    ("0,1\n\n0,1\n", "Line 2 is blank, but the board continues on line 3."),
+    ('0,"1\n', "Line 1: error reading CSV file: unexpected end of data"),
+])
+def test_first_error_is_located(text, message):
+    with pytest.raises(ValueError) as error:
+        read(text)
+    assert str(error.value) == message
+
+
+def test_reading_stops_at_the_first_error():
+    rows = iter(["0,1\n", "0,9\n", "0,0\n"])
+
+    with pytest.raises(ValueError, match="Line 2"):
+        CsvSave.read(rows)
+    assert next(rows) == "0,0\n"  # The line after the error is never read
+
+    endless = ("0,0\n" for _ in iter(int, 1))
+    with pytest.raises(ValueError, match="Line 6: the board has more than the limit of 10 cells."):
+        CsvSave.read(endless, max_cells=10)
+
+
+def test_cell_cap():
+    assert read("0,0\n0,0\n", max_cells=4)[:2] == (2, 2)
+    with pytest.raises(ValueError, match="Line 3: the board has more than the limit of 4 cells."):
+        read("0,0\n0,0\n0,0\n", max_cells=4)
+    # A malformed row is reported as such, even past the limit
+    with pytest.raises(ValueError, match="Line 3, column 2: invalid cell state 'x'"):
+        read("0,0\n0,0\n0,x\n", max_cells=4)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_board_loaders(tmp_path, engine):
+    bad = tmp_path / "bad.csv"
+    bad.write_text("Game Time: 00:00:00\n0,1\n1,3,0\n")
+    board = engine(Difficulty.BEGINNER, rng=0)
+    before = board._state_bytes()
+
+    with pytest.raises(ValueError, match="Line 3 has 3 cells, expected 2"):
+        board.load_board(str(bad))
+    assert board._state_bytes() == before  # Unchanged by the failed load
+    with pytest.raises(ValueError, match="File not found"):
+        board.load_board(str(tmp_path / "missing.csv"))
+
+    board.save_board(str(tmp_path / "board.msb"))
+    with pytest.raises(ValueError, match="more than the limit of 10"):
+        board.load_board(str(tmp_path / "board.msb"), max_cells=10)
+    board.save_board(str(tmp_path / "board.csv"))
+    with pytest.raises(ValueError, match="Line 3: the board has more than the limit of 10"):
+        board.load_board(str(tmp_path / "board.csv"), max_cells=10)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("", 7), ("12", 12), (" 12 ", 12), ("abc", 7), ("0", 7), ("-3", 7),
+])
+def test_positive_int_from_environment(monkeypatch, capsys, value, expected):
+    monkeypatch.setenv("TEST_SETTING", value)
+
+    assert Utility.positive_int_from_environment("TEST_SETTING", 7) == expected
+    assert ("Warning: TEST_SETTING" in capsys.readouterr().err) is (expected == 7 and value != "")
+
+
+def test_bad_limit_falls_back_to_the_default():
+    result = subprocess.run(
+        [sys.executable, "-c", "import model.save_format as f; print(f.MAX_CELLS)"],
+        capture_output=True, text=True, cwd=ROOT, env={**os.environ, MAX_CELLS_ENV: "lots"}, timeout=60,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == str(DEFAULT_MAX_CELLS)
+    assert f"{MAX_CELLS_ENV} must be a positive integer, got 'lots'" in result.stderr
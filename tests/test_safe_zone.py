@@ -0,0 +1,91 @@
+import pytest
+
+from model.board import Board, SafeZone
+from model.cell import CellType
+from model.difficulty import Difficulty, CustomDifficulty
+from model.packed_board import PackedBoard
+
+ENGINES = [Board, PackedBoard]
+
+
+def layout(board):
+    return {
+        (x, y): board.tiles[x][y].type
+        for x in range(board.dif.x_size)
+        for y in range(board.dif.y_size)
+        if board.tiles[x][y].type != CellType.EMPTY
+    }
+
+
+def area(board, x, y):
+    return {
+        (nx, ny)
+        for nx in range(x - 1, x + 2)
+        for ny in range(y - 1, y + 2)
+        if 0 <= nx < board.dif.x_size and 0 <= ny < board.dif.y_size
+    }
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_items_wait_for_the_first_reveal(engine):
+    board = engine(Difficulty.BEGINNER, SafeZone.CELL, rng=1)
+
+    assert board.items_pending
+    assert layout(board) == {}
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("safe_zone", list(SafeZone))
+@pytest.mark.parametrize("seed", range(20))
+def test_first_reveal_keeps_the_safe_zone_clear(engine, safe_zone, seed):
+    board = engine(Difficulty.INTERMEDIATE, safe_zone, rng=seed)
+    x, y = seed % 16, (seed * 7) % 16
+
+    assert board.reveal_cell(x, y) is None
+    items = layout(board)
+    zone = area(board, x, y) if safe_zone == SafeZone.AREA else {(x, y)}
+    assert not zone & items.keys()
+    assert list(items.values()).count(CellType.MINE) == Difficulty.INTERMEDIATE.max_mines
+    assert list(items.values()).count(CellType.TREASURE) == Difficulty.INTERMEDIATE.max_treasures
+    assert not board.items_pending
+    assert board.tiles[x][y].is_checked
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_neighbor_counts_match_the_placed_items(engine):
+    board = engine(Difficulty.EXPERT, SafeZone.AREA, rng=5)
+    board.reveal_cell(10, 8)
+    items = layout(board)
+
+    for x in range(board.dif.x_size):
+        for y in range(board.dif.y_size):
+            neighbors = area(board, x, y) - {(x, y)}
+            cell = board.tiles[x][y]
+            assert cell.nearby_mines == sum(items.get(n) == CellType.MINE for n in neighbors)
+            assert cell.nearby_treasures == sum(items.get(n) == CellType.TREASURE for n in neighbors)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_same_seed_places_the_same_layout(engine):
+    boards = [engine(Difficulty.EXPERT, SafeZone.AREA, rng=42) for _ in range(2)]
+    for board in boards:
+        board.reveal_cell(3, 4)
+
+    assert layout(boards[0]) == layout(boards[1])
+    assert boards[0].layout_key() == boards[1].layout_key()
+
+
+def test_both_engines_place_the_same_layout():
+    boards = [engine(Difficulty.INTERMEDIATE, SafeZone.CELL, rng=9) for engine in ENGINES]
+    for board in boards:
+        board.reveal_cell(0, 0)
+
+    assert layout(boards[0]) == layout(boards[1])
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_zone_larger_than_the_free_cells_is_rejected(engine):
+    board = engine(CustomDifficulty(3, 3, 2, 2, 1, 1), SafeZone.AREA, rng=0)
+
+    with pytest.raises(ValueError, match="too small"):
+        board.reveal_cell(1, 1)
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_script(tmp_path, lines, *options):
+    script = tmp_path / "moves.txt"
+    script.write_text("\n".join(lines) + "\n")
+    return subprocess.run(
+        [sys.executable, str(ROOT / "run.py"), "BEGINNER", "text", "--script", str(script), "--plain", *options],
+        capture_output=True, text=True, cwd=ROOT, timeout=60,
+    )
+
+
+def test_save_mid_script_keeps_running(tmp_path):
+    save = tmp_path / "saved.csv"
+    result = run_script(tmp_path, ["click 1 1", f"save {save}", "flag 3 3", "flag 8 8"], "--seed", "3", "--safe-zone", "cell")
+
+    assert result.returncode == 0, result.stderr
+    assert f"Board successfully saved to {save}." in result.stdout
+    assert "Script: 3 moves, 0 invalid commands" in result.stdout
+    assert "5" in save.read_text()  # The first click is in the save, as a checked empty cell
+
+
+def test_save_without_path_is_invalid_in_scripts(tmp_path):
+    result = run_script(tmp_path, ["save", "flag 1 1"], "--seed", "3")
+
+    assert result.returncode == 0, result.stderr
+    assert "Script: 1 moves, 1 invalid commands" in result.stdout
@@ -0,0 +1,125 @@
+import random
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+from model.board import Board
+from model.difficulty import Difficulty, CustomDifficulty
+from model.packed_board import PackedBoard
+from model.validator import Validator
+
+ROOT = Path(__file__).resolve().parent.parent
+ENGINES = [Board, PackedBoard]
+
+
+def brute_force(mines, size):
+    """The original combinations() scan over the mines in row-major order."""
+    for combination in combinations(mines, size):
+        if len({r for r, _ in combination}) != size or len({c for _, c in combination}) != size:
+            continue
+        if not any(r == c for r, c in combination):
+            continue
+        remaining = [mine for mine in mines if mine not in combination]
+        if remaining and not any(Validator._adjacent(remaining[0], mine) for mine in combination):
+            continue
+        if len(remaining) == 2 and any(Validator._adjacent(remaining[1], mine) for mine in combination + (remaining[0],)):
+            continue
+        return True
+    return False
+
+
+def random_case(rng):
+    x_size, y_size = rng.randint(2, 7), rng.randint(2, 7)
+    cells = [(r, c) for r in range(x_size) for c in range(y_size)]
+    if rng.random() < 0.6:
+        # Mostly one mine per row and column, where valid sets are common
+        columns = list(range(y_size))
+        rng.shuffle(columns)
+        diagonal = [(r, columns[r]) for r in range(min(x_size, y_size))]
+        extra = rng.sample(cells, rng.randint(0, min(5, len(cells))))
+        mines = sorted(set(diagonal[:rng.randint(1, len(diagonal))] + extra))
+    else:
+        mines = sorted(rng.sample(cells, rng.randint(1, min(12, len(cells)))))
+    return mines, rng.randint(1, len(mines))
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("name, violation", [
+    ("valid.csv", None),
+    ("invalid.csv", ("mine_set", "No valid combination of 6 mines satisfies the constraints.")),
+    ("test.csv", ("mine_set", "No valid combination of 6 mines satisfies the constraints.")),
+])
+def test_sample_boards(engine, name, violation):
+    board = engine(Difficulty.BEGINNER)
+    board.load_board(str(ROOT / name))
+
+    assert Validator.find_violation(board) == violation
+    assert Validator.validate_board(board) is (violation is None)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_search_matches_the_combinations_scan(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        mines, size = random_case(rng)
+        assert Validator._find_mine_set(mines, size) == brute_force(mines, size), (mines, size)
+
+
+@pytest.mark.parametrize("mines, size, expected", [
+    ([(0, 0)], 1, True),
+    ([(0, 1)], 1, False),  # No mine on the diagonal
+    ([(0, 0), (1, 1)], 2, True),
+    ([(0, 0), (0, 1)], 2, False),  # Same row
+    ([(0, 0), (0, 1)], 1, True),  # (0, 1) is left out and touches (0, 0)
+    ([(0, 0), (2, 2)], 1, False),  # The left-out mine touches nothing
+    ([(0, 0), (1, 2), (2, 0)], 1, False),
+    ([(0, 0), (1, 1), (2, 2)], 4, False),  # More mines than exist
+])
+def test_search_on_small_cases(mines, size, expected):
+    assert Validator._find_mine_set(mines, size) is expected
+
+
+@pytest.mark.parametrize("mines, size, expected", [
+    # A diagonal plus extra mines, so more than two are left out and the matching completes the set
+    (sorted({(i, i) for i in range(8)} | {(0, 1), (5, 2), (6, 4), (7, 3)}), 6, True),
+    # One mine per row and column but only one on the diagonal, and no valid set exists
+    (sorted({(0, 1), (1, 3), (2, 5), (3, 7), (4, 2), (5, 4), (6, 6), (7, 0)}), 4, False),
+])
+def test_search_with_many_mines_left_out(mines, size, expected):
+    assert len(mines) - size > 2
+    assert Validator._find_mine_set(mines, size) is brute_force(mines, size) is expected
+
+
+@pytest.mark.parametrize("mines, target, expected", [
+    ([], 3, 0),
+    ([(0, 0), (0, 1), (1, 0)], 5, 2),
+    ([(0, 0), (1, 0), (2, 0)], 5, 1),  # One shared column
+    ([(0, 0), (0, 1), (1, 0), (1, 1), (2, 2)], 5, 3),
+    ([(r, c) for r in range(6) for c in range(6)], 2, 2),  # Stops at the target
+])
+def test_max_matching(mines, target, expected):
+    assert Validator._max_matching(mines, target) == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("difficulty", list(Difficulty))
+def test_random_preset_boards(difficulty, seed):
+    board = Board(difficulty, rng=seed)
+    mines = sorted((cell.x, cell.y) for row in board.tiles for cell in row if cell.type.name == "MINE")
+    found = Validator.find_violation(board)
+
+    if difficulty == Difficulty.BEGINNER:  # Small enough for the scan
+        assert (found is None) == brute_force(mines, difficulty.min_mines)
+    assert found is None or found[0] == "mine_set"
+
+
+def test_rules_are_checked_in_order():
+    board = Board(CustomDifficulty(4, 4, 3, 2, 1, 0), rng=0)
+    board.load_board(str(ROOT / "valid.csv"))
+    board.dif = CustomDifficulty(4, 4, 3, 2, 1, 0)
+
+    assert Validator.find_violation(board)[0] == "dimensions"
+
+    board.dif = CustomDifficulty(8, 8, 3, 2, 1, 0)
+    assert Validator.find_violation(board)[0] == "mine_count"
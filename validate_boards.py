@@ -0,0 +1,101 @@
+import argparse
+import glob
+import json
+import os
+import sys
+
+from shared.contract_level import LEVELS, LEVEL_ENV, configure_contracts
+
+configure_contracts()
+
+from model.batch import BatchValidator
+from model.validation_cache import ValidationCache, CACHE_ENV, DEFAULT_MAX_ENTRIES
+from model.save_format import BINARY_EXTENSION, CSV_EXTENSION
+
+
+def find_board_files(patterns: list):
+    """
+    Expands the command line arguments into save files.
+
+    Args:
+        patterns (list[str]): Files, directories (searched recursively for *.csv and *.msb) or glob patterns.
+
+    Returns:
+        list[str]: The matching files, sorted within each argument and without duplicates.
+    """
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [
+                path
+                for extension in (CSV_EXTENSION, BINARY_EXTENSION)
+                for path in glob.glob(os.path.join(pattern, "**", "*" + extension), recursive=True)
+            ]
+        else:
+            matches = glob.glob(pattern, recursive=True) or [pattern]  # Missing files are reported as load failures
+        files.extend(sorted(matches))
+    return list(dict.fromkeys(files))
+
+
+def main():
+    """
+    Validates saved boards in bulk and streams one JSON line per file.
+    Usage:
+        python validate_boards.py <path|directory|glob>... [--workers N] [--chunk-size N] [--contracts full|cheap|off]
+                                  [--cache FILE [--cache-size N]]
+        Example:
+        python validate_boards.py valid.csv invalid.csv
+        python validate_boards.py boards/ --workers 8 --chunk-size 128 --contracts off
+        python validate_boards.py "uploads/**/*.csv" --workers 1 --cache validation.sqlite
+    The exit status is 1 if any board is invalid. With a cache, its hit and miss counts
+    are printed to stderr at the end.
+    """
+    parser = argparse.ArgumentParser(description="Validate saved Minesweeper boards in bulk.")
+    parser.add_argument("paths", nargs="+", help="CSV or .msb saves, directories searched recursively, or glob patterns.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes, 1 validates in this process (default: one per CPU).")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Number of files per worker task (default 64).")
+    parser.add_argument(
+        "--contracts",
+        choices=LEVELS,
+        default=os.environ.get(LEVEL_ENV, "full"),
+        help="Contract checking level while loading: full (default), cheap or off",
+    )
+    parser.add_argument(
+        "--cache",
+        default=ValidationCache.default_path(),
+        help=f"SQLite file that caches validation results by board layout (default: ${CACHE_ENV}).",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help=f"Most entries the cache keeps, least recently used ones are evicted (default {DEFAULT_MAX_ENTRIES}).",
+    )
+    args = parser.parse_args()
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be positive.")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive.")
+    if args.cache_size < 1:
+        parser.error("--cache-size must be positive.")
+
+    all_valid = True
+    hits = misses = 0
+    results = BatchValidator.validate(
+        find_board_files(args.paths), args.workers, args.chunk_size, args.cache, args.cache_size
+    )
+    for result in results:
+        all_valid = all_valid and result["valid"]
+        if result["cached"]:
+            hits += 1
+        elif result["rule"] != "load":
+            misses += 1
+        print(json.dumps(result), flush=True)
+    if args.cache:
+        print(f"Validation cache: {hits} hits, {misses} misses", file=sys.stderr)
+    sys.exit(0 if all_valid else 1)
+
+
+if __name__ == "__main__":
+    main()
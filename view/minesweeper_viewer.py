@@ -23,14 +23,40 @@ class MinesweeperViewer(ABC):
         pass
 
     @abstractmethod
-    def update(self, model: Board):
-        """Updates the view based on the current model state."""
+    def update(self, model: Board, changes: set = None):
+        """
+        Updates the view based on the current model state.
+
+        Args:
+            model (Board): The current state of the Minesweeper board.
+            changes (set): The (x, y) coordinates of the cells that changed since the
+                last update, or None to redraw every cell.
+        """
         pass
     
     @abstractmethod
     def update_timer(self):
         """Updates the timer display."""
         pass
+
+    @abstractmethod
+    def schedule(self, delay, callback):
+        """
+        Runs a callback on the view's own loop after a delay.
+
+        Args:
+            delay (float): The delay in seconds.
+            callback (Callable[[], None]): The function to run.
+
+        Returns:
+            object: A handle that cancels the callback when passed to `cancel`.
+        """
+        pass
+
+    @abstractmethod
+    def cancel(self, handle):
+        """Cancels a callback scheduled with `schedule`."""
+        pass
     
     @abstractmethod
     def display_message(self, message):
@@ -1,24 +1,74 @@
 from view.minesweeper_viewer import MinesweeperViewer
 from model.board import Board
 from model.cell import CellType
-from icontract import require, ensure
+from model.save_format import BinarySave, CSV_EXTENSION
+from shared.contracts import require, ensure
+import shutil
 import sys
+import time
+from collections import Counter
+from itertools import chain, count
+
+# Cursor-addressing escape codes for the ANSI renderer
+ANSI_HOME = "\x1b[H"
+ANSI_CLEAR_SCREEN = "\x1b[2J"
+ANSI_CLEAR_LINE = "\x1b[K"
+ANSI_CLEAR_BELOW = "\x1b[J"
+ANSI_HELP = "Commands: click x y / flag x y / up|down|left|right [n] / goto x y / save / exit"
+FRAME_HEADER_LINES = 4  # Status line, separator, column labels and their underline
+FRAME_FOOTER_LINES = 4  # Blank line, help line, prompt and a spare line for the entered command
+
+# Largest viewport when stdout is not a terminal, same as the canvas viewer
+VIEWPORT_ROWS = 30
+VIEWPORT_COLUMNS = 40
+PAN_DIRECTIONS = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+
 
 class TextView(MinesweeperViewer):
     """Represents a text-based interface for Minesweeper."""
 
     @require(lambda: issubclass(MinesweeperViewer, object), "MinesweeperViewer must be defined")
-    def __init__(self):
-        """Initializes the TextView with no controller initially."""
+    def __init__(self, ansi: bool = None, script=None, frame_every: int = 0, restart: bool = False):
+        """
+        Initializes the TextView with no controller initially.
+
+        Args:
+            ansi (bool): Redraw only changed cells with cursor-addressing escape codes. If None,
+                they are used when stdout is a terminal.
+            script (Iterable[str]): Command lines to apply back to back instead of reading
+                them interactively. Scripts never use escape codes.
+            frame_every (int): Script mode only, print every Nth frame. 0 prints only the
+                final board with the summary.
+            restart (bool): Script mode only, the answer to every "play again" prompt.
+        """
         super().__init__(None)  # Initialize with no controller for now
+        self.terminal = sys.stdout.isatty()
+        self.ansi = (self.terminal if ansi is None else ansi) and script is None
+        self.script = iter(script) if script is not None else None
+        self.frame_every = frame_every
+        self.restart = restart
+        self.frames = 0  # Board updates in script mode
+        self.moves = 0  # Clicks and flags applied in script mode
+        self.errors = 0  # Invalid script lines
+        self.outcomes = Counter()  # Messages shown at the end of each game in script mode
+        self.started = time.perf_counter()
+        self.timers = {}  # Scheduled callbacks by handle, as (due monotonic time, callback)
+        self.timer_handles = count()
 
     def initialize_board(self):
         """Sets up the text-based board display with a legend."""
         self.elapsed_time = "00:00:00"  # Timer display
         self.x_size = 0
         self.y_size = 0
+        self.model = None
+        self.origin = (0, 0)  # Board coordinates of the top-left cell of the viewport
+        self.view_rows = 0
+        self.view_columns = 0
+        self.moved = False  # The viewport moved since the last frame, so it is drawn in full
         print("Welcome to Minesweeper!")
         print("Commands: 'click x y', 'flag x y', or 'save' to save the game.")
+        print("Boards larger than the terminal show a window: 'up', 'down', 'left' or 'right'")
+        print("followed by an optional number of cells moves it, 'goto x y' centers it on a cell.")
         print("Type 'exit' to quit the game.")
         print("\nLegend:")
         print("  .  : Unchecked cell")
@@ -30,85 +80,388 @@ class TextView(MinesweeperViewer):
         print("  (space): Checked cell with no nearby mines")
         print("-" * 30)
 
-    def display_status(self):
-        """Displays the game status, including the timer and a separator."""
-        print(f"Time Elapsed: {self.elapsed_time}")
-        print("-" * 30)
+    @staticmethod
+    def cell_symbol(cell):
+        """
+        Returns the single character that represents a cell on the text board.
+
+        Args:
+            cell (Cell): The cell to render.
+
+        Returns:
+            str: The symbol of the cell, see the legend.
+        """
+        if cell.is_checked:
+            if cell.type != CellType.MINE and cell.is_flagged:
+                return "X"  # Incorrect flag
+            elif cell.type == CellType.MINE:
+                return "M"  # Mine
+            elif cell.type == CellType.TREASURE:
+                return "T"  # Treasure
+            elif cell.nearby_mines == 0:
+                return " "  # No nearby mines
+            else:
+                return str(cell.nearby_mines)  # Number of nearby mines
+        elif cell.is_flagged:
+            return "F"  # Flag
+        else:
+            return "."  # Unchecked cell
+
+    def frame_lines(self, model: Board):
+        """
+        Builds the lines of a full frame: the status, the column headers and the board
+        rows inside the viewport, preceded by an overview line when the board is clipped.
+
+        Args:
+            model (Board): The current state of the Minesweeper board.
+
+        Returns:
+            list[str]: The lines of the frame, without line breaks.
+        """
+        first_x, first_y = self.origin
+        columns = range(first_y, first_y + self.view_columns)
+        width = self.label_width()
+        lines = [f"Time Elapsed: {self.elapsed_time}", "-" * 30]
+        if self.is_clipped():
+            lines.append(self.overview_line())
+
+        # Create column headers (shifted to start from 1, last two digits on wide boards)
+        lines.append(" " * (width + 2) + "".join(f"{(y + 1) % 100:2}" for y in columns))
+        lines.append(" " * (width + 1) + "-" * (self.view_columns * 2 + 1))  # Add horizontal line separator
+
+        # Create each row with a row label (shifted to start from 1)
+        for x in range(first_x, first_x + self.view_rows):
+            lines.append(self.row_line(model, x, width))
+        return lines
+
+    def row_line(self, model: Board, x: int, width: int):
+        """
+        Renders the part of a board row inside the viewport, with its label.
+
+        Args:
+            model (Board): The current state of the Minesweeper board.
+            x (int): The board row.
+            width (int): The width of the row labels.
+
+        Returns:
+            str: The rendered row.
+        """
+        cells = model.tiles[x]
+        first_y = self.origin[1]
+        symbols = " ".join(self.cell_symbol(cells[y]) for y in range(first_y, first_y + self.view_columns))
+        return f"{x+1:{width}} | " + symbols  # Add row label and vertical separator
+
+    def overview_line(self):
+        """
+        Renders the position of the viewport on the board as one compressed line.
+
+        Returns:
+            str: The visible row and column ranges with a bar for each, where '#' marks the visible part.
+        """
+        first_x, first_y = self.origin
+        return (
+            f"Rows {first_x + 1}-{first_x + self.view_rows} of {self.x_size} "
+            f"[{self.overview_bar(first_x, self.view_rows, self.x_size)}]  "
+            f"Columns {first_y + 1}-{first_y + self.view_columns} of {self.y_size} "
+            f"[{self.overview_bar(first_y, self.view_columns, self.y_size)}]"
+        )
+
+    @staticmethod
+    def overview_bar(first, visible, size, length=20):
+        """
+        Compresses a board dimension into a bar of fixed length.
+
+        Args:
+            first (int): The first visible row or column.
+            visible (int): The number of visible rows or columns.
+            size (int): The number of rows or columns on the board.
+            length (int): The length of the bar.
+
+        Returns:
+            str: The bar, '#' for the visible part and '-' for the rest.
+        """
+        start = first * length // size
+        end = max(start + 1, -(-(first + visible) * length // size))  # Round up, at least one mark
+        return "-" * start + "#" * (end - start) + "-" * (length - end)
+
+    def label_width(self):
+        """
+        Returns the width of the row labels, at least 2 characters.
+
+        Returns:
+            int: The number of characters of the widest row label.
+        """
+        return max(2, len(str(self.x_size)))
+
+    def header_lines(self):
+        """
+        Returns the number of lines above the first board row.
+
+        Returns:
+            int: The status, separator and column label lines, plus the overview line if the board is clipped.
+        """
+        return FRAME_HEADER_LINES + self.is_clipped()
+
+    def is_clipped(self):
+        """
+        Checks whether the viewport shows only part of the board.
+
+        Returns:
+            bool: True if some rows or columns are outside the viewport.
+        """
+        return self.view_rows < self.x_size or self.view_columns < self.y_size
+
+    def fit_viewport(self):
+        """
+        Sizes the viewport to the terminal, or to VIEWPORT_ROWS x VIEWPORT_COLUMNS when stdout
+        is not a terminal, and keeps it inside the board.
+
+        Returns:
+            bool: True if the viewport size changed.
+        """
+        if self.terminal:
+            size = shutil.get_terminal_size()
+            # Reserve the overview line in case the board does not fit
+            rows = size.lines - FRAME_HEADER_LINES - 1 - FRAME_FOOTER_LINES
+            columns = (size.columns - self.label_width() - 3) // 2
+        else:
+            rows, columns = VIEWPORT_ROWS, VIEWPORT_COLUMNS
+        rows = min(self.x_size, max(1, rows))
+        columns = min(self.y_size, max(1, columns))
+        resized = (rows, columns) != (self.view_rows, self.view_columns)
+        self.view_rows, self.view_columns = rows, columns
+        self.move_viewport(*self.origin)
+        return resized
+
+    def move_viewport(self, first_x, first_y):
+        """
+        Moves the top-left cell of the viewport, kept inside the board.
+
+        Args:
+            first_x (int): The first visible row.
+            first_y (int): The first visible column.
+        """
+        origin = (
+            max(0, min(first_x, self.x_size - self.view_rows)),
+            max(0, min(first_y, self.y_size - self.view_columns)),
+        )
+        if origin != self.origin:
+            self.origin = origin
+            self.moved = True
+
+    def focus(self, x, y):
+        """
+        Centers the viewport on a cell if the cell is outside of it.
+
+        Args:
+            x (int): The row of the cell.
+            y (int): The column of the cell.
+        """
+        first_x, first_y = self.origin
+        if not (first_x <= x < first_x + self.view_rows and first_y <= y < first_y + self.view_columns):
+            self.move_viewport(x - self.view_rows // 2, y - self.view_columns // 2)
+
+    def pan(self, direction, distance=None):
+        """
+        Moves the viewport and redraws the board.
+
+        Args:
+            direction (str): One of "up", "down", "left" or "right".
+            distance (int): The number of cells to move, half the viewport by default.
+        """
+        dx, dy = PAN_DIRECTIONS[direction]
+        if distance is None:
+            distance = max(1, (self.view_rows if dx else self.view_columns) // 2)
+        self.move_viewport(self.origin[0] + dx * distance, self.origin[1] + dy * distance)
+        self.update(self.model)
 
     @require(lambda model: isinstance(model, Board), "model must be an instance of Board")
     def display_board(self, model: Board):
-        """Displays the Minesweeper board in text form, reflecting the current model state."""
-        self.display_status()  # Show timer and separator
+        """Displays the viewport of the Minesweeper board in text form, in one write."""
+        sys.stdout.write("\n".join(self.frame_lines(model)) + "\n\n\n\n")
+        sys.stdout.flush()
+
+    def prompt_row(self):
+        """
+        Returns the terminal row of the input prompt in ANSI mode.
 
-        # Create column headers (shifted to start from 1)
-        column_labels = "    " + "".join(f"{i+1:2}" for i in range(len(model.tiles[0])))
-        print(column_labels)
-        print("   " + "-" * (len(model.tiles[0]) * 2 + 1))  # Add horizontal line separator
+        Returns:
+            int: The 1-based row below the board, a blank line and the help line.
+        """
+        return self.header_lines() + self.view_rows + 3
 
-        # Create each row with a row label (shifted to start from 1)
-        for idx, row in enumerate(model.tiles):
-            row_repr = []
-            for cell in row:
-                if cell.is_checked:
-                    if cell.type != CellType.MINE and cell.is_flagged:
-                        row_repr.append("X")  # Incorrect flag
-                    elif cell.type == CellType.MINE:
-                        row_repr.append("M")  # Mine
-                    elif cell.type == CellType.TREASURE:
-                        row_repr.append("T")  # Treasure
-                    elif cell.nearby_mines == 0:
-                        row_repr.append(" ")  # No nearby mines
-                    else:
-                        row_repr.append(str(cell.nearby_mines))  # Number of nearby mines
-                elif cell.is_flagged:
-                    row_repr.append("F")  # Flag
+    def draw_ansi(self, model: Board, changes: set = None):
+        """
+        Draws the board with cursor-addressing escape codes, writing the whole frame once
+        and afterwards only the timer and the changed cells inside the viewport, then
+        clears the prompt area.
+
+        Args:
+            model (Board): The current state of the Minesweeper board.
+            changes (set): The (x, y) coordinates of the changed cells, or None to redraw
+                the whole screen.
+        """
+        if changes is None:
+            lines = self.frame_lines(model) + ["", ANSI_HELP]
+            frame = [ANSI_HOME + ANSI_CLEAR_SCREEN, "\n".join(lines), "\n"]
+        else:
+            frame = [f"\x1b[1;1HTime Elapsed: {self.elapsed_time}" + ANSI_CLEAR_LINE]
+            width = self.label_width()
+            first_x, first_y = self.origin
+            rows = {}
+            for x, y in changes:
+                if 0 <= x - first_x < self.view_rows and 0 <= y - first_y < self.view_columns:
+                    rows.setdefault(x, []).append(y)
+            first_row = self.header_lines() + 1 - first_x
+            for x, columns in rows.items():
+                row = first_row + x
+                if len(columns) > self.view_columns // 4:  # Rewriting the row is shorter than addressing each cell
+                    frame.append(f"\x1b[{row};1H" + self.row_line(model, x, width) + ANSI_CLEAR_LINE)
                 else:
-                    row_repr.append(".")  # Unchecked cell
-            print(f"{idx+1:2} | " + " ".join(row_repr))  # Add row label and vertical separator
-        print("\n\n")
+                    cells = model.tiles[x]
+                    frame.extend(
+                        f"\x1b[{row};{width + 4 + 2 * (y - first_y)}H{self.cell_symbol(cells[y])}" for y in columns
+                    )
+            frame.append(f"\x1b[{self.prompt_row()};1H" + ANSI_CLEAR_BELOW)
+        sys.stdout.write("".join(frame))
+        sys.stdout.flush()
 
     def run(self):
-        """Starts the text-based game loop."""
+        """Starts the text-based game loop, or applies the script if there is one."""
+        if self.script is not None:
+            self.run_script()
+            return
         self.keep_going = True
         while self.keep_going:
+            self.run_due_timers()
             cmd = input("Enter command (click x y / flag x y / save): ").strip()
-            if cmd.lower() == "exit":
-                self.cleanup()
-                sys.exit(0)
-            elif cmd.lower() == "save":
-                self.save_board()
+            try:
+                self.execute(cmd)
+            except ValueError as e:
+                print(e)
+
+    def run_script(self):
+        """
+        Applies every command of the script back to back, then prints the summary and exits.
+        Blank lines and lines starting with '#' are skipped.
+        """
+        self.started = time.perf_counter()
+        for line_number, line in enumerate(self.script, 1):
+            cmd = line.strip()
+            if not cmd or cmd.startswith("#"):
+                continue
+            try:
+                self.execute(cmd)
+            except ValueError as e:
+                self.errors += 1
+                print(f"Line {line_number}: {e}")
+        self.cleanup()
+
+    def execute(self, cmd):
+        """
+        Applies one command: click, flag, save, exit or a viewport movement.
+
+        Args:
+            cmd (str): The command line, with board coordinates starting from 1.
+
+        Raises:
+            ValueError: If the command or its arguments are invalid.
+        """
+        parts = cmd.split()
+        command = parts[0].lower() if parts else ""
+        if command == "exit" and len(parts) == 1:
+            self.cleanup()
+        elif command == "save" and len(parts) <= 2:
+            if len(parts) == 1 and self.script is not None:
+                raise ValueError("Invalid command! Use 'save <path>' in scripts.")
+            self.save_board(parts[1] if len(parts) == 2 else None)
+        elif command in PAN_DIRECTIONS and len(parts) <= 2:
+            if len(parts) == 2 and not parts[1].isdigit():
+                raise ValueError("Invalid input: the distance must be a positive number.")
+            self.pan(command, int(parts[1]) if len(parts) == 2 else None)
+        elif command in ("click", "flag", "goto") and len(parts) == 3:
+            try:
+                x, y = int(parts[2]) - 1, int(parts[1]) - 1
+            except ValueError as e:
+                raise ValueError(f"Invalid input: {e}") from e
+            if not (0 <= x < self.x_size and 0 <= y < self.y_size):
+                raise ValueError("Invalid input: Coordinates are out of bounds!")
+
+            if command == "goto":
+                self.move_viewport(x - self.view_rows // 2, y - self.view_columns // 2)
+                self.update(self.model)
+                return
+            self.focus(x, y)
+            self.moves += 1
+            if command == "click":
+                self.keep_going = not self.controller.handle_click(x, y)
             else:
-                parts = cmd.split()
-                if len(parts) == 3:
-                    try:
-                        x, y = int(parts[2]) - 1, int(parts[1]) - 1
-
-                        if not (0 <= x < self.x_size and 0 <= y < self.y_size):
-                            raise ValueError("Coordinates are out of bounds!")
-
-                        if parts[0].lower() == "click":
-                            self.keep_going = not self.controller.handle_click(x, y)
-                        elif parts[0].lower() == "flag":
-                            self.keep_going = not self.controller.handle_flag(x, y)
-                        else:
-                            print("Invalid command! Use 'click x y', 'flag x y', or 'save'.")
-                    except ValueError as e:
-                        print(f"Invalid input: {e}")
-                else:
-                    print("Invalid command! Use 'click x y', 'flag x y', or 'save'.")
+                self.keep_going = not self.controller.handle_flag(x, y)
+        else:
+            raise ValueError("Invalid command! Use 'click x y', 'flag x y', or 'save'.")
 
     @require(lambda model: isinstance(model, Board), "model must be an instance of Board")
-    def update(self, model: Board):
-        """Updates the console view with the current board state."""
-        self.x_size = model.dif.x_size
-        self.y_size = model.dif.y_size
-        self.display_board(model)
+    def update(self, model: Board, changes: set = None):
+        """
+        Updates the console view with the current board state.
+
+        Args:
+            model (Board): The current state of the Minesweeper board.
+            changes (set): The (x, y) coordinates of the cells that changed since the
+                last update, or None to render every cell again.
+        """
+        self.model = model
+        if self.x_size != model.dif.x_size or self.y_size != model.dif.y_size:
+            self.x_size = model.dif.x_size
+            self.y_size = model.dif.y_size
+            self.origin = (0, 0)
+            changes = None
+        if self.fit_viewport() or self.moved:
+            changes = None
+        if self.script is not None:
+            self.frames += 1
+            if not self.frame_every or self.frames % self.frame_every:
+                return  # Frames in between are skipped, the viewport catches up on the next one
+        self.moved = False
+
+        self.run_due_timers()  # Show the current time with the board
+        if self.ansi:
+            self.draw_ansi(model, changes)
+        else:
+            self.display_board(model)
 
     @require(lambda elapsed_time: isinstance(elapsed_time, str), "elapsed_time must be a string")
     def update_timer(self, elapsed_time):
         """Updates the timer display."""
         self.elapsed_time = elapsed_time
 
+    def schedule(self, delay, callback):
+        """
+        Runs a callback after a delay. The text view's loop blocks on input, so due
+        callbacks run each time the loop turns or the board is displayed.
+
+        Args:
+            delay (float): The delay in seconds.
+            callback (Callable[[], None]): The function to run.
+
+        Returns:
+            int: A handle for `cancel`.
+        """
+        handle = next(self.timer_handles)
+        self.timers[handle] = (time.monotonic() + delay, callback)
+        return handle
+
+    def cancel(self, handle):
+        """Cancels a callback scheduled with `schedule`."""
+        self.timers.pop(handle, None)
+
+    def run_due_timers(self):
+        """Runs the scheduled callbacks whose delay has passed."""
+        now = time.monotonic()
+        for handle, (due, callback) in list(self.timers.items()):
+            if due <= now and self.timers.pop(handle, None):
+                callback()
+
     @require(lambda message: isinstance(message, str), "message must be a string")
     @ensure(lambda result: isinstance(result, bool), "Return value must be a boolean")
     def display_message(self, message):
@@ -121,6 +474,10 @@ class TextView(MinesweeperViewer):
         Returns:
             bool: True if the player wants to restart, False otherwise.
         """
+        if self.script is not None:
+            self.outcomes[message] += 1
+            print(f"{message} {'yes' if self.restart else 'no'}")
+            return self.restart
         print(message)
         while True:
             restart = input("Do you want to play again? (yes/no): ").strip().lower()
@@ -136,24 +493,37 @@ class TextView(MinesweeperViewer):
         Returns:
             str or None: The path to the saved board file, or None if skipped.
         """
+        if self.script is not None:
+            # A script loads a board with a 'load <path>' first line, any other line is kept
+            first = next(self.script, "")
+            parts = first.split()
+            if len(parts) == 2 and parts[0].lower() == "load":
+                return parts[1]
+            self.script = chain([first], self.script)
+            return None
         path = input("Enter the path to a saved board file, or press Enter to skip: ").strip()
         return path if path else None
 
     @require(lambda self: self.controller is not None, "Controller must be set.")
-    def save_board(self):
+    def save_board(self, file_path: str = None):
         """
-        Prompts the user to enter a file path and saves the current board to a CSV file.
+        Saves the current board, in binary for .msb paths and as CSV otherwise, prompting the user for the path if not given.
+
+        Args:
+            file_path (str): The file name or path to save the board to.
         """
-        file_path = input("Enter the file name or path to save the board: ").strip()
+        if file_path is None:
+            file_path = input("Enter the file name or path to save the board: ").strip()
         
-        # Append .csv if not already present
-        if not file_path.lower().endswith(".csv"):
-            file_path += ".csv"
+        # Append .csv if no save extension is present, .msb saves in the binary format
+        if not (file_path.lower().endswith(CSV_EXTENSION) or BinarySave.is_binary_path(file_path)):
+            file_path += CSV_EXTENSION
         
         if file_path:
             try:
-                self.controller.save_game(file_path)
-                print(f"Board successfully saved to {file_path}.")
+                # Scripts keep running after a save, interactive play exits
+                if self.controller.save_game(file_path, exit_after=self.script is None):
+                    print(f"Board successfully saved to {file_path}.")
             except Exception as e:
                 print(f"Error: Failed to save the board. {e}")
         else:
@@ -162,6 +532,18 @@ class TextView(MinesweeperViewer):
     @require(lambda self: hasattr(self, "controller"), "Controller attribute must exist.")
     @ensure(lambda: True, "Ensure that cleanup does not throw any exceptions.")
     def cleanup(self):
-        """Performs cleanup tasks before exiting the game."""
+        """Performs cleanup tasks before exiting the game, printing the summary of a script."""
+        if self.script is not None:
+            self.print_summary()
         print("Exiting the game. Goodbye!")
         sys.exit(0) # Need to explicitly exit here to get out of input loop
+
+    def print_summary(self):
+        """Prints the final board and the statistics of a script run."""
+        if self.model is not None:
+            self.run_due_timers()
+            self.display_board(self.model)
+        seconds = time.perf_counter() - self.started
+        print(f"Script: {self.moves} moves, {self.errors} invalid commands, {self.frames} frames in {seconds:.3f} s")
+        for message, games in self.outcomes.items():
+            print(f"  {message} {games} time(s)")
@@ -0,0 +1,215 @@
+from tkinter import Canvas, Scrollbar
+from model.board import Board
+from view.tkinter.tkinter_view import BTN_CLICK, BTN_FLAG, PLAIN, TkinterViewer
+from shared.contracts import require
+
+# Most tile rows and columns drawn at once, larger boards scroll
+VIEWPORT_ROWS = 30
+VIEWPORT_COLUMNS = 40
+
+
+class CanvasViewer(TkinterViewer):
+    """
+    Represents a GUI-based interface for Minesweeper that draws the board on a single Tkinter Canvas.
+
+    Only the tiles inside a fixed-size viewport exist as canvas items, and boards larger
+    than the viewport scroll. Building the window and redrawing it cost the same for any
+    board size, and updates only touch the items of changed cells.
+    """
+
+    def __init__(self, max_fps: int = 60):
+        """
+        Initializes the CanvasViewer with the shared window, images and labels, plus the canvas.
+
+        Args:
+            max_fps (int): Most board repaints per second, see TkinterViewer.
+        """
+        super().__init__(max_fps)
+
+        self.tile_size = self.images["plain"].width()
+        self.canvas = Canvas(self.frame, highlightthickness=0, borderwidth=0)
+        self.canvas.bind(BTN_CLICK, lambda event: self.on_canvas_event(event, self.controller.handle_click))
+        self.canvas.bind(BTN_FLAG, lambda event: self.on_canvas_event(event, self.controller.handle_flag))
+        self.canvas.bind("<MouseWheel>", lambda event: self.scroll_rows("scroll", -1 if event.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_rows("scroll", -1, "units"))  # X11 wheel up
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_rows("scroll", 1, "units"))  # X11 wheel down
+        self.row_scrollbar = Scrollbar(self.frame, orient="vertical", command=self.scroll_rows)
+        self.column_scrollbar = Scrollbar(self.frame, orient="horizontal", command=self.scroll_columns)
+
+        self.items = []  # Canvas image items of the viewport, by viewport row and column
+        self.item_states = []  # Render state last applied to each item
+        self.origin = (0, 0)  # Board coordinates of the top-left tile of the viewport
+        self.model = None
+        self.x_size = 0
+        self.y_size = 0
+
+    @require(lambda self: self.controller is not None, "Controller must be assigned before initializing the board")
+    def initialize_board(self):
+        """
+        Sizes the canvas and its viewport for the current board, reusing the tile items
+        when the viewport size is unchanged.
+        """
+        board: Board = self.controller.get_board()
+        self.model = board
+        self.x_size = board.dif.x_size
+        self.y_size = board.dif.y_size
+        self.origin = (0, 0)
+
+        rows, columns = min(self.x_size, VIEWPORT_ROWS), min(self.y_size, VIEWPORT_COLUMNS)
+        if len(self.items) != rows or len(self.items[0]) != columns:
+            tile = self.tile_size
+            gfx = self.images["plain"]
+            self.canvas.delete("all")
+            self.canvas.config(width=columns * tile, height=rows * tile)
+            self.items = [
+                [self.canvas.create_image(column * tile, row * tile, image=gfx, anchor="nw") for column in range(columns)]
+                for row in range(rows)
+            ]
+            self.item_states = [[PLAIN] * columns for _ in range(rows)]
+
+        # Place the canvas, its scrollbars and the UI labels
+        self.labels["time"].grid(row=0, column=0, columnspan=2)
+        self.canvas.grid(row=1, column=0)
+        if self.x_size > rows:
+            self.row_scrollbar.grid(row=1, column=1, sticky="ns")
+        else:
+            self.row_scrollbar.grid_remove()
+        if self.y_size > columns:
+            self.column_scrollbar.grid(row=2, column=0, sticky="ew")
+        else:
+            self.column_scrollbar.grid_remove()
+        self.labels["mines"].grid(row=3, column=0, sticky="w")
+        self.labels["flags"].grid(row=3, column=0, sticky="e")
+        self.save_button.grid(row=4, column=0, columnspan=2, pady=10)
+
+    def render(self, model: Board, changes: set = None):
+        """
+        Draws the model state on the viewport items.
+
+        Args:
+            model (Board): The current state of the Minesweeper board.
+            changes (set): The (x, y) coordinates of the cells that changed since the
+                last paint, or None to redraw the whole viewport.
+        """
+        self.labels["mines"].config(text=f"Mines: {model.actual_mines}")
+        self.labels["flags"].config(text=f"Flags: {model.flag_count}")
+        self.model = model
+
+        # If board size changes, reinitialize it and redraw everything
+        if self.x_size != model.dif.x_size or self.y_size != model.dif.y_size:
+            self.initialize_board()
+            changes = None
+
+        if changes is None:
+            self.draw_viewport()
+            return
+
+        first_x, first_y = self.origin
+        rows, columns = len(self.items), len(self.items[0])
+        applied = skipped = 0
+        for x, y in changes:
+            row, column = x - first_x, y - first_y
+            if 0 <= row < rows and 0 <= column < columns:  # Cells outside the viewport are drawn when scrolled to
+                if self.apply_item_state(row, column, self.render_state(model.tiles[x][y])):
+                    applied += 1
+                else:
+                    skipped += 1
+        self.record_frame(applied, skipped)
+
+    def draw_viewport(self):
+        """
+        Draws every tile of the viewport and syncs the scrollbars with its position.
+        """
+        first_x, first_y = self.origin
+        tiles = self.model.tiles
+        applied = skipped = 0
+        for row, row_items in enumerate(self.items):
+            cells = tiles[first_x + row]
+            for column in range(len(row_items)):
+                if self.apply_item_state(row, column, self.render_state(cells[first_y + column])):
+                    applied += 1
+                else:
+                    skipped += 1
+        self.record_frame(applied, skipped)
+
+        rows, columns = len(self.items), len(self.items[0])
+        self.row_scrollbar.set(first_x / self.x_size, (first_x + rows) / self.x_size)
+        self.column_scrollbar.set(first_y / self.y_size, (first_y + columns) / self.y_size)
+
+    def apply_item_state(self, row, column, state):
+        """
+        Shows a render state on a viewport item, skipping the Tcl call if it already shows it.
+
+        Args:
+            row (int): Row of the item in the viewport.
+            column (int): Column of the item in the viewport.
+            state (int): The render state of the cell, see TkinterViewer.render_state.
+
+        Returns:
+            bool: True if the item was reconfigured, False if it was skipped.
+        """
+        if self.item_states[row][column] == state:
+            return False
+        self.item_states[row][column] = state
+        self.canvas.itemconfig(self.items[row][column], image=self.tile_images[state])
+        return True
+
+    def on_canvas_event(self, event, handler):
+        """
+        Translates a click on the canvas into the board cell under the pointer.
+
+        Args:
+            event (Event): The Tkinter mouse event.
+            handler (Callable): The controller method to call with the cell coordinates.
+        """
+        row, column = event.y // self.tile_size, event.x // self.tile_size
+        if 0 <= row < len(self.items) and 0 <= column < len(self.items[0]):
+            handler(self.origin[0] + row, self.origin[1] + column)
+
+    def scroll_rows(self, *args):
+        """
+        Scrolls the viewport vertically, used as the vertical scrollbar command.
+
+        Args:
+            *args: Scrollbar arguments, ("moveto", fraction) or ("scroll", count, "units" | "pages").
+        """
+        if not self.items:
+            return
+        first_x = self.scroll_position(args, self.origin[0], self.x_size, len(self.items))
+        if first_x != self.origin[0]:
+            self.origin = (first_x, self.origin[1])
+            self.draw_viewport()
+
+    def scroll_columns(self, *args):
+        """
+        Scrolls the viewport horizontally, used as the horizontal scrollbar command.
+
+        Args:
+            *args: Scrollbar arguments, ("moveto", fraction) or ("scroll", count, "units" | "pages").
+        """
+        if not self.items:
+            return
+        first_y = self.scroll_position(args, self.origin[1], self.y_size, len(self.items[0]))
+        if first_y != self.origin[1]:
+            self.origin = (self.origin[0], first_y)
+            self.draw_viewport()
+
+    @staticmethod
+    def scroll_position(args, first, size, visible):
+        """
+        Computes the first visible row or column after a scrollbar command.
+
+        Args:
+            args (tuple): Scrollbar arguments, ("moveto", fraction) or ("scroll", count, "units" | "pages").
+            first (int): The currently first visible row or column.
+            size (int): The number of rows or columns on the board.
+            visible (int): The number of rows or columns in the viewport.
+
+        Returns:
+            int: The new first visible row or column, kept inside the board.
+        """
+        if args[0] == "moveto":
+            first = round(float(args[1]) * size)
+        elif args[0] == "scroll":
+            first += int(args[1]) * (visible if args[2] == "pages" else 1)
+        return max(0, min(first, size - visible))
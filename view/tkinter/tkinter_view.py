@@ -1,21 +1,31 @@
 import platform
+import time
 from tkinter import Button, Frame, Label, PhotoImage, Tk, filedialog, messagebox, simpledialog
 from controller.controller import Controller
 from model.cell import CellType
 from model.board import Board
+from model.save_format import BinarySave, CSV_EXTENSION
 from view.minesweeper_viewer import MinesweeperViewer
-from icontract import require, ensure
+from shared.contracts import require, ensure
 
 BTN_CLICK = "<Button-1>"
 BTN_FLAG = "<Button-2>" if platform.system() == 'Darwin' else "<Button-3>"
 
+# Render states of a cell, used as indices into TkinterViewer.tile_images
+PLAIN, FLAG, WRONG, MINE, TREASURE, CLICKED = range(6)  # CLICKED + n: revealed with n nearby mines
+
 
 class TkinterViewer(MinesweeperViewer):
     """Represents a GUI-based interface for Minesweeper using Tkinter."""
 
-    def __init__(self):
+    @require(lambda max_fps: isinstance(max_fps, int) and max_fps >= 0, "max_fps must be a non-negative integer")
+    def __init__(self, max_fps: int = 60):
         """
         Initializes the TkinterViewer with a Tkinter window, image resources, and layout.
+
+        Args:
+            max_fps (int): Most board repaints per second. Updates in between are merged
+                into the next repaint. 0 repaints as soon as Tk is idle.
         """
         super().__init__(None)  # Initialize with no controller initially
 
@@ -32,6 +42,10 @@ class TkinterViewer(MinesweeperViewer):
             "treasure": PhotoImage(file="images/tile_treasure.png"),
             "numbers": [PhotoImage(file=f"images/tile_{i}.gif") for i in range(1, 9)],
         }
+        self.tile_images = [
+            self.images["plain"], self.images["flag"], self.images["wrong"], self.images["mine"],
+            self.images["treasure"], self.images["clicked"], *self.images["numbers"],
+        ]
 
         # Set up the main frame for buttons and labels
         self.frame = Frame(self.tk)
@@ -54,13 +68,25 @@ class TkinterViewer(MinesweeperViewer):
             font=("Arial", 12, "bold")
         )
 
-        self.buttons = []  # Store buttons for the game grid
+        self.buttons = []  # Pool of grid buttons, by row and column, at least as large as the board
+        self.shown_size = (0, 0)  # Rows and columns of the pool currently placed in the grid
+        self.button_states = []  # Render state last applied to each pooled button
+        self.frame_stats = {"applied": 0, "skipped": 0}  # Widget updates of the last update call
+        self.total_stats = {"applied": 0, "skipped": 0}  # Widget updates since the view was created
         self.elasped_time = "00:00:00"
         self.is_running = True
 
+        # Coalesced repaints: updates mark the view dirty and one scheduled paint applies them all
+        self.frame_interval = 1 / max_fps if max_fps else 0.0
+        self.pending_model = None
+        self.pending_changes = set()  # Changed cells since the last paint, None for a full redraw
+        self.dirty_since = None  # perf_counter time of the first update not yet painted
+        self.last_paint = 0.0
+        self.paint_job = None
+        self.latency_stats = {"frames": 0, "updates": 0, "last_ms": 0.0, "max_ms": 0.0}
+
     def run(self):
         """Starts the Tkinter main loop."""
-        self.start_timer()
         self.tk.mainloop()
 
     @ensure(lambda result: result is None or isinstance(result, str), "Result must be None or a valid file path")
@@ -75,7 +101,7 @@ class TkinterViewer(MinesweeperViewer):
         if response:  # User clicked 'Yes'
             file_path = filedialog.askopenfilename(
                 title="Select a Saved Board File",
-                filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
+                filetypes=[("Saved Boards", "*.csv *.msb"), ("CSV Files", "*.csv"), ("Binary Saves", "*.msb"), ("All Files", "*.*")]
             )
             return file_path if file_path else None
         return None  # User clicked 'No'
@@ -84,14 +110,11 @@ class TkinterViewer(MinesweeperViewer):
     def initialize_board(self):
         """
         Sets up the buttons dynamically for the current board size based on the controller's model.
-        """
-        # Clear existing buttons
-        if self.buttons:
-            for button_row in self.buttons:
-                for button in button_row:
-                    button.destroy()
-            self.buttons = []
 
+        Buttons are pooled across games. A restart on the same board size only resets
+        them to the plain tile, and a new size creates or hides just the buttons
+        outside the previous size.
+        """
         # Get board information from the controller
         board: Board = self.controller.get_board()
         self.x_size = board.dif.x_size
@@ -103,62 +126,204 @@ class TkinterViewer(MinesweeperViewer):
         self.labels["flags"].grid(row=self.x_size + 1, column=self.y_size // 2, columnspan=self.y_size // 2)
         self.save_button.grid(row=self.x_size + 2, column=0, columnspan=self.y_size, pady=10)
 
-        # Create grid buttons
-        gfx = self.images["plain"]
-        for x, row in enumerate(board.tiles):
-            button_row = []
-            for y, _ in enumerate(row):
-                button = Button(self.frame, image=gfx)
-                button.grid(row=x + 1, column=y)
-                button.bind(BTN_CLICK, lambda event, x=x, y=y: self.controller.handle_click(x, y))  # Left-click
-                button.bind(BTN_FLAG, lambda event, x=x, y=y: self.controller.handle_flag(x, y))  # Right-click
-                button_row.append(button)
-            self.buttons.append(button_row)
+        # Grow the pool to cover the board
+        for x in range(self.x_size):
+            if x == len(self.buttons):
+                self.buttons.append([])
+                self.button_states.append([])
+            button_row = self.buttons[x]
+            while len(button_row) < self.y_size:
+                button_row.append(self.create_button(x, len(button_row)))
+                self.button_states[x].append(PLAIN)
+
+        # Reset and show the buttons on the board, hide the rest of the pool
+        shown_x, shown_y = self.shown_size
+        for x, button_row in enumerate(self.buttons):
+            for y, button in enumerate(button_row):
+                was_shown = x < shown_x and y < shown_y
+                if x < self.x_size and y < self.y_size:
+                    self.apply_state(x, y, PLAIN)
+                    if not was_shown:
+                        button.grid(row=x + 1, column=y)
+                elif was_shown:
+                    button.grid_remove()
+        self.shown_size = (self.x_size, self.y_size)
+
+    def create_button(self, x, y):
+        """
+        Creates the pooled button of a grid position, bound to its cell but not yet placed.
+
+        Args:
+            x (int): X-coordinate of the cell.
+            y (int): Y-coordinate of the cell.
+
+        Returns:
+            Button: The new button.
+        """
+        button = Button(self.frame, image=self.images["plain"])
+        button.bind(BTN_CLICK, lambda event: self.controller.handle_click(x, y))  # Left-click
+        button.bind(BTN_FLAG, lambda event: self.controller.handle_flag(x, y))  # Right-click
+        return button
 
     @require(lambda elapsed_time: isinstance(elapsed_time, str), "Elapsed time must be a string")
     def update_timer(self, elapsed_time):
         """Updates the timer display."""
         self.elasped_time = elapsed_time
+        self.labels["time"].config(text=elapsed_time)
 
-    def start_timer(self):
-        """Starts the periodic timer updates."""
-        if self.is_running:
-            self.labels["time"].config(text=self.elasped_time)
-            self.tk.after(1000, self.start_timer)  # Schedule the next update
+    def schedule(self, delay, callback):
+        """
+        Runs a callback on the Tk event loop after a delay.
+
+        Args:
+            delay (float): The delay in seconds.
+            callback (Callable[[], None]): The function to run.
+
+        Returns:
+            str: The Tk `after` id, for `cancel`.
+        """
+        return self.tk.after(int(delay * 1000) + 1, callback)  # Round up, never fire early
+
+    def cancel(self, handle):
+        """Cancels a callback scheduled with `schedule`."""
+        self.tk.after_cancel(handle)
 
     @require(lambda model: isinstance(model, Board), "Model must be an instance of Board")
-    def update(self, model: Board):
+    def update(self, model: Board, changes: set = None):
+        """
+        Marks the view dirty and schedules one repaint for all updates until it runs.
+
+        The repaint runs when Tk is idle, but no sooner than one frame interval after
+        the previous repaint, so bursts of clicks and flags cost a single paint.
+
+        Args:
+            model (Board): The current state of the Minesweeper board.
+            changes (set): The (x, y) coordinates of the cells that changed since the
+                last update, or None to reconfigure every button.
+        """
+        self.pending_model = model
+        if changes is None or self.pending_changes is None:
+            self.pending_changes = None
+        else:
+            self.pending_changes |= changes
+        self.latency_stats["updates"] += 1
+
+        if self.paint_job is None:
+            self.dirty_since = time.perf_counter()
+            delay = self.last_paint + self.frame_interval - self.dirty_since
+            if delay > 0:
+                self.paint_job = self.tk.after(int(delay * 1000) + 1, self.paint)
+            else:
+                self.paint_job = self.tk.after_idle(self.paint)
+
+    def paint(self):
+        """
+        Applies every update since the last paint in one pass and records its latency.
+        """
+        self.paint_job = None
+        model, changes = self.pending_model, self.pending_changes
+        if model is None:
+            return
+        self.pending_model, self.pending_changes = None, set()
+        self.render(model, changes)
+
+        self.last_paint = time.perf_counter()
+        latency_ms = (self.last_paint - self.dirty_since) * 1000
+        stats = self.latency_stats
+        stats["frames"] += 1
+        stats["last_ms"] = latency_ms
+        stats["max_ms"] = max(stats["max_ms"], latency_ms)
+
+    def flush(self):
+        """
+        Paints pending updates right away instead of waiting for the scheduled paint.
+        """
+        if self.paint_job is not None:
+            self.tk.after_cancel(self.paint_job)
+            self.paint()
+
+    def render(self, model: Board, changes: set = None):
         """
-        Updates the view to reflect the current model state.
+        Draws the model state on the grid buttons.
 
         Args:
             model (Board): The current state of the Minesweeper board.
+            changes (set): The (x, y) coordinates of the cells that changed since the
+                last paint, or None to reconfigure every button.
         """
         self.labels["mines"].config(text=f"Mines: {model.actual_mines}")
         self.labels["flags"].config(text=f"Flags: {model.flag_count}")
         
-        # If board size changes, reinitialize it
+        # If board size changes, reinitialize it and redraw everything
         if self.x_size != model.dif.x_size or self.y_size != model.dif.y_size:
             self.initialize_board()
+            changes = None
 
-        for x, row in enumerate(self.buttons):
-            for y, button in enumerate(row):
-                cell = model.tiles[x][y]
-                if cell.is_checked:
-                    if cell.type != CellType.MINE and cell.is_flagged:
-                        button.config(image=self.images["wrong"])
-                    elif cell.type == CellType.MINE:
-                        button.config(image=self.images["mine"])
-                    elif cell.type == CellType.TREASURE:
-                        button.config(image=self.images["treasure"])
-                    elif cell.nearby_mines == 0:
-                        button.config(image=self.images["clicked"], state="disabled")
-                    else:
-                        button.config(image=self.images["numbers"][cell.nearby_mines - 1], state="disabled")
-                elif cell.is_flagged:
-                    button.config(image=self.images["flag"])
-                else:
-                    button.config(image=self.images["plain"])
+        if changes is None:
+            changes = ((x, y) for x in range(self.x_size) for y in range(self.y_size))
+
+        applied = skipped = 0
+        tiles = model.tiles
+        for x, y in changes:
+            if self.apply_state(x, y, self.render_state(tiles[x][y])):
+                applied += 1
+            else:
+                skipped += 1
+        self.record_frame(applied, skipped)
+
+    def apply_state(self, x, y, state):
+        """
+        Shows a render state on a grid button, skipping the Tcl call if it already shows it.
+
+        Args:
+            x (int): X-coordinate of the cell.
+            y (int): Y-coordinate of the cell.
+            state (int): The render state of the cell, see render_state.
+
+        Returns:
+            bool: True if the button was reconfigured, False if it was skipped.
+        """
+        if self.button_states[x][y] == state:
+            return False
+        self.button_states[x][y] = state
+        self.buttons[x][y].config(image=self.tile_images[state], state="disabled" if state >= CLICKED else "normal")
+        return True
+
+    def record_frame(self, applied, skipped):
+        """
+        Stores the widget update counters of the last update and adds them to the totals.
+
+        Args:
+            applied (int): Widget updates that were sent to Tk.
+            skipped (int): Widget updates skipped because the widget already showed the state.
+        """
+        self.frame_stats = {"applied": applied, "skipped": skipped}
+        self.total_stats["applied"] += applied
+        self.total_stats["skipped"] += skipped
+
+    @staticmethod
+    def render_state(cell):
+        """
+        Encodes what a cell looks like as a small integer.
+
+        Args:
+            cell (Cell): The cell to show.
+
+        Returns:
+            int: PLAIN, FLAG, WRONG, MINE or TREASURE, or CLICKED plus the number of nearby
+            mines for a revealed safe cell. It indexes tile_images.
+        """
+        if cell.is_checked:
+            if cell.type != CellType.MINE and cell.is_flagged:
+                return WRONG
+            elif cell.type == CellType.MINE:
+                return MINE
+            elif cell.type == CellType.TREASURE:
+                return TREASURE
+            return CLICKED + cell.nearby_mines
+        elif cell.is_flagged:
+            return FLAG
+        return PLAIN
 
     @require(lambda message: isinstance(message, str), "Message must be a string")
     @ensure(lambda result: isinstance(result, bool), "Result must be a boolean")
@@ -172,6 +337,7 @@ class TkinterViewer(MinesweeperViewer):
         Returns:
             bool: True if the user wants to play again, False otherwise.
         """
+        self.flush()  # Paint the final board state now, even inside the frame interval
         self.tk.update()  # Force the UI to refresh before showing the dialog
         return messagebox.askyesno("Game Over", message)
     
@@ -182,6 +348,10 @@ class TkinterViewer(MinesweeperViewer):
         if hasattr(self, "is_running"):
             self.is_running = False
 
+        if self.paint_job is not None:
+            self.tk.after_cancel(self.paint_job)
+            self.paint_job = None
+
         if hasattr(self, "tk") and self.tk.winfo_exists():
             self.tk.quit()  # Stop the Tkinter mainloop
             self.tk.update_idletasks()  # Process remaining tasks
@@ -190,16 +360,16 @@ class TkinterViewer(MinesweeperViewer):
     @require(lambda self: self.controller is not None, "Controller must be set.")
     def save_board(self):
         """
-        Prompts the user to enter a file path and saves the current board to a CSV file.
+        Prompts the user to enter a file path and saves the current board, in binary for .msb paths and as CSV otherwise.
         """
         file_path = simpledialog.askstring(
             "Save Game", "Enter the file name or path to save the board:"
         )
         if file_path:
             try:
-                # Append .csv if not already present
-                if not file_path.lower().endswith(".csv"):
-                    file_path += ".csv"
+                # Append .csv if no save extension is present, .msb saves in the binary format
+                if not (file_path.lower().endswith(CSV_EXTENSION) or BinarySave.is_binary_path(file_path)):
+                    file_path += CSV_EXTENSION
 
                 # Save the game using the controller
                 self.controller.save_game(file_path)